@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "interview.core",
     "interview.inventory",
@@ -53,6 +54,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "interview.core.middleware.PinnedVersionsMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -91,6 +93,30 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Alias and timeout (seconds) of the serialized inventory cache.
+INVENTORY_CACHE_ALIAS = "default"
+INVENTORY_CACHE_TIMEOUT = 300
+
+# Maximum number of items accepted by the inventory batch create endpoint.
+INVENTORY_BATCH_MAX_SIZE = 1000
+
+# Maximum number of ids accepted by the multi-get endpoints.
+MULTI_GET_MAX_IDS = 100
+
+# Maximum number of ids accepted by the bulk order state endpoints; larger
+# selections are made with a filter instead.
+ORDER_STATE_MAX_IDS = 10000
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -133,6 +159,31 @@ STATIC_ROOT = "interview/static"
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'interview/media'
 
+REST_FRAMEWORK = {
+    # Splices cached JSON fragments into responses, see interview.core.fragments.
+    "DEFAULT_RENDERER_CLASSES": [
+        "interview.core.fragments.FragmentJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
+
+# Pagination
+# How paginated lists compute their total: "exact", "cached", "estimate" or "none".
+# See interview.core.pagination.CountStrategyPagination.
+
+PAGINATION_COUNT_STRATEGY = "exact"
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+
+# Seconds autocomplete suggestions are cached for.
+AUTOCOMPLETE_CACHE_TIMEOUT = 30
+
+# The vocabulary bundle is regenerated whenever a vocabulary changes; these
+# bound how long the shared cache keeps it and how long clients may reuse it
+# before revalidating.
+VOCABULARY_BUNDLE_TIMEOUT = 60 * 60 * 24
+VOCABULARY_BUNDLE_MAX_AGE = 60
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
 
@@ -22,6 +22,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("inventory/", include("interview.inventory.urls")),
     path("orders/", include("interview.order.urls")),
+    path("vocabularies/", include("interview.core.urls")),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,75 @@
+"""
+Prefix autocomplete over ``name`` columns.
+
+Lookups are case-insensitive prefix matches (``UPPER(name) LIKE 'PRE%'``)
+ordered by ``UPPER(name)`` in the "C" collation then id, both answered from
+one expression index (see ``prefix_index``). They return a small bounded list
+and are cached for a few seconds, since typeahead clients repeat the same
+prefixes on every keystroke.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, models
+from django.db.models.functions import Collate, Upper
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+def prefix_index(name: str) -> models.Index:
+    """
+    Index serving ``name__istartswith`` lookups in ``AutocompleteView`` order.
+    In the "C" collation the default operator class supports ``LIKE``
+    prefixes, whatever the database collation, and matches that order.
+    """
+    return models.Index(Collate(Upper("name"), "C"), models.F("id"), name=name)
+
+
+class AutocompleteView(APIView):
+    """Subclasses set ``queryset`` and a ``cache_prefix`` unique to the view."""
+
+    queryset = None
+    cache_prefix = None
+    query_param = "q"
+    limit_query_param = "limit"
+    default_limit = 10
+    max_limit = 20
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        prefix = request.query_params.get(self.query_param, "").strip()
+        if not prefix:
+            return Response(
+                {"error": f"The {self.query_param} parameter is required."}, status=400
+            )
+
+        limit = self.get_limit(request)
+        key = self.get_cache_key(prefix, limit)
+        results = cache.get(key)
+        if results is None:
+            results = list(self.get_queryset(prefix)[:limit])
+            cache.set(key, results, settings.AUTOCOMPLETE_CACHE_TIMEOUT)
+
+        return Response(results, status=200)
+
+    def get_queryset(self, prefix: str):
+        queryset = self.queryset.filter(name__istartswith=prefix)
+        key = Upper("name")
+        if connections[queryset.db].vendor == "postgresql":
+            # The order of ``prefix_index``, so the scan stops at ``limit``.
+            key = Collate(key, "C")
+        return queryset.order_by(key, "id").values("id", "name")
+
+    def get_limit(self, request) -> int:
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        if limit <= 0:
+            return self.default_limit
+        return min(limit, self.max_limit)
+
+    def get_cache_key(self, prefix: str, limit: int) -> str:
+        digest = hashlib.md5(prefix.encode("utf-8")).hexdigest()
+        return f"autocomplete:{self.cache_prefix}:{limit}:{digest}"
@@ -1,5 +1,9 @@
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
+
+from interview.core.signals import active_changed
+from interview.core.vocabulary import get_vocabulary
 
 
 class UUIDModel(models.Model):
@@ -31,12 +35,46 @@ class IsActiveModel(models.Model):
         abstract = True
 
     @classmethod
-    def activate(cls, pk: int):
-        cls.objects.filter(pk=pk).update(is_active=False)
+    def activate(cls, pks) -> int:
+        return cls.set_active(pks, True)
+
+    @classmethod
+    def deactivate(cls, pks) -> int:
+        return cls.set_active(pks, False)
 
     @classmethod
-    def deactivate(cls, pk: int):
-        cls.objects.filter(pk=pk).update(is_active=True)
+    def set_active(cls, pks, is_active: bool) -> int:
+        """
+        Set ``is_active`` on the rows selected by ``pks`` (a primary key, a
+        list of them or a queryset of the model) with a single ``UPDATE`` that
+        also moves ``updated_at`` forward. Rows already in that state are left
+        untouched; returns the number of rows changed.
+
+        The update bypasses ``post_save``, so ``active_changed`` is sent
+        instead, with the changed keys read first when anything listens.
+        """
+        queryset = cls.get_selection(pks).exclude(is_active=is_active)
+
+        changes = {"is_active": is_active}
+        if issubclass(cls, TimestampedModel):
+            changes["updated_at"] = timezone.now()
+
+        if not active_changed.has_listeners(cls):
+            return queryset.update(**changes)
+        with transaction.atomic():
+            changed = list(queryset.values_list("pk", flat=True))
+            count = cls.objects.filter(pk__in=changed).update(**changes)
+        active_changed.send(sender=cls, pks=changed)
+        return count
+
+    @classmethod
+    def get_selection(cls, pks) -> models.QuerySet:
+        """The rows selected by ``pks``, as accepted by ``set_active``."""
+        if isinstance(pks, models.QuerySet):
+            return pks
+        if isinstance(pks, (list, tuple, set, frozenset)):
+            return cls.objects.filter(pk__in=pks)
+        return cls.objects.filter(pk=pks)
 
 
 class NameModel(models.Model):
@@ -58,6 +96,11 @@ class UniqueNameModel(models.Model):
 
     @classmethod
     def get_by_name(cls, name: str):
+        vocabulary = get_vocabulary(cls)
+        if vocabulary is not None:
+            row = vocabulary.get_by_name(name)
+            return vocabulary.instance(row) if row is not None else None
+
         try:
             return cls.objects.get(name=name)
         except ObjectDoesNotExist:
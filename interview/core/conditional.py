@@ -0,0 +1,97 @@
+"""
+Cheap HTTP validators (``ETag`` / ``Last-Modified``) for conditional GETs.
+
+Validators are derived from ``updated_at`` columns and version stamps only, so
+a matching ``If-None-Match`` or ``If-Modified-Since`` is answered with a 304
+before anything is serialized.
+"""
+import hashlib
+from typing import NamedTuple, Optional
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from interview.core.versions import version_datetime
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: Optional[int]
+
+
+def build_validators(request, parts, timestamps) -> Validators:
+    """
+    Hash ``parts`` together with the request path and query string into a
+    strong ETag; the most recent of ``timestamps`` is the Last-Modified.
+    """
+    source = repr((request.get_full_path(), *parts)).encode("utf-8")
+    etag = quote_etag(hashlib.sha1(source).hexdigest())
+    timestamps = [value for value in timestamps if value is not None]
+    # HTTP dates have a resolution of one second.
+    last_modified = int(max(timestamps).timestamp()) if timestamps else None
+    return Validators(etag, last_modified)
+
+
+def queryset_validators(
+    request, queryset, timestamp_fields=("updated_at",), versions=()
+) -> Validators:
+    """
+    Validators for a list: the newest of each timestamp field plus the row
+    count of ``queryset``, computed in a single aggregate query. ``versions``
+    are stamps from ``interview.core.versions`` covering related data whose
+    changes do not show up in those fields. Deleting a row moves none of the
+    timestamps, only the count, so lists get an ETag but no Last-Modified.
+    """
+    aggregates = {
+        f"latest_{index}": Max(field) for index, field in enumerate(timestamp_fields)
+    }
+    row = queryset.order_by().aggregate(rows=Count("pk"), **aggregates)
+    latest = [row[f"latest_{index}"] for index in range(len(timestamp_fields))]
+    return build_validators(request, [row["rows"], *latest, *versions], [])
+
+
+def rows_validators(
+    request, rows, timestamp_fields=("updated_at",), versions=(), parts=()
+) -> Validators:
+    """
+    Validators for rows already read, e.g. a page: their ids and timestamp
+    fields, ``versions`` and any other ``parts`` (whether a next page exists).
+    ``rows`` are ``values()`` rows. Rows leaving the page do not move any
+    timestamp, so only the ETag is set.
+    """
+    keys = [(row["id"], *(row[field] for field in timestamp_fields)) for row in rows]
+    return build_validators(request, [keys, *parts, *versions], [])
+
+
+def instance_validators(request, instance, versions=()) -> Validators:
+    """
+    Validators for a single row, from its ``updated_at``. ``instance`` is a
+    model instance or a ``values()`` row.
+    """
+    if isinstance(instance, dict):
+        pk, updated_at = instance["id"], instance["updated_at"]
+    else:
+        pk, updated_at = instance.pk, instance.updated_at
+    return build_validators(
+        request,
+        [pk, updated_at, *versions],
+        [updated_at, *map(version_datetime, versions)],
+    )
+
+
+def not_modified(request, validators: Validators):
+    """Return a 304 response when the request's preconditions match."""
+    response = get_conditional_response(
+        request, etag=validators.etag, last_modified=validators.last_modified
+    )
+    if response is not None:
+        set_validators(response, validators)
+    return response
+
+
+def set_validators(response, validators: Validators):
+    response["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response["Last-Modified"] = http_date(validators.last_modified)
+    return response
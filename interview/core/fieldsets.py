@@ -0,0 +1,71 @@
+"""
+Sparse fieldsets (``?fields=``) and expandable relations (``?expand=``).
+
+``?fields=id,name`` limits a representation to the listed fields and
+``?expand=type`` nests only the listed relations, the others being rendered
+as bare ids (or lists of ids). Without the parameters every field is returned
+and every relation is nested, so the default representation is unchanged.
+"""
+from rest_framework.exceptions import ValidationError
+
+
+class Fieldset:
+    fields_query_param = "fields"
+    expand_query_param = "expand"
+
+    def __init__(self, fields, relations, selected=None, expand=None):
+        self.all_fields = tuple(fields)
+        self.relations = frozenset(relations)
+        self.fields = self.all_fields if selected is None else tuple(selected)
+        self.expand = self.relations if expand is None else frozenset(expand)
+
+    @classmethod
+    def from_request(cls, request, fields, relations) -> "Fieldset":
+        """Parse the query parameters, rejecting unknown names with a 400."""
+        errors = {}
+        selected = cls.parse(request, cls.fields_query_param, fields, errors)
+        expand = cls.parse(request, cls.expand_query_param, relations, errors)
+        if errors:
+            raise ValidationError(errors)
+        if selected is not None:
+            # Output keys keep the order of the full representation.
+            selected = [field for field in fields if field in selected]
+        return cls(fields, relations, selected, expand)
+
+    @staticmethod
+    def parse(request, param: str, allowed, errors: dict):
+        value = request.query_params.get(param)
+        if value is None:
+            return None
+        names = {name.strip() for name in value.split(",") if name.strip()}
+        unknown = sorted(names.difference(allowed))
+        if unknown:
+            errors[param] = [f"Unknown field '{name}'." for name in unknown]
+        return names
+
+    @property
+    def complete(self) -> bool:
+        """Whether this is the default, full representation."""
+        return self.fields == self.all_fields and self.expand == self.relations
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.fields
+
+    def expands(self, relation: str) -> bool:
+        return relation in self.fields and relation in self.expand
+
+    def project(self, data: dict) -> dict:
+        """Narrow a full representation to this fieldset."""
+        return {
+            field: data[field]
+            if field not in self.relations or field in self.expand
+            else collapse(data[field])
+            for field in self.fields
+        }
+
+
+def collapse(value):
+    """Replace a nested object, or a list of them, by its id."""
+    if isinstance(value, list):
+        return [item["id"] for item in value]
+    return value["id"]
@@ -0,0 +1,113 @@
+"""
+Per-row JSON fragment caching.
+
+Each row's representation is cached as the JSON bytes ``FragmentJSONRenderer``
+would produce for it, under a key derived from the row (typically its id and
+``updated_at``). A list response is then assembled by joining the cached bytes
+of its rows: only misses are rendered, and one changed row never invalidates
+the rest of a page.
+"""
+import json
+import uuid
+
+from rest_framework.renderers import JSONRenderer
+
+
+def render_fragment(data) -> bytes:
+    return JSONRenderer().render(data)
+
+
+class FragmentList:
+    """
+    A list of representations held as JSON fragments.
+
+    It is not a ``list``: ``FragmentJSONRenderer`` splices the fragments into
+    its output without parsing them. Anything else decodes them, once, on
+    first use as a sequence (iteration, indexing, comparison) or through
+    ``tolist``, which is how DRF's ``JSONEncoder``, hence ``JSONRenderer``
+    and the NDJSON helpers, encode it: as a regular array.
+    """
+
+    def __init__(self, fragments=()):
+        self.fragments = list(fragments)
+        self.items = None
+
+    @property
+    def decoded(self) -> bool:
+        return self.items is not None
+
+    def decode(self) -> list:
+        if self.items is None:
+            self.items = [json.loads(fragment) for fragment in self.fragments]
+        return self.items
+
+    def joined(self) -> bytes:
+        return b"[" + b",".join(self.fragments) + b"]"
+
+    def tolist(self) -> list:
+        # How DRF's JSONEncoder turns array-likes (numpy arrays...) into lists.
+        return self.decode()
+
+    def __len__(self) -> int:
+        return len(self.fragments)
+
+    def __iter__(self):
+        return iter(self.decode())
+
+    def __getitem__(self, index):
+        return self.decode()[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FragmentList):
+            other = other.decode()
+        return self.decode() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"FragmentList({self.decode()!r})"
+
+
+class FragmentJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` that splices ``FragmentList`` bytes into the output,
+    whether it is the response data or a value of the response dict (e.g. the
+    ``results`` of a paginated response).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        fragments = {}
+        if isinstance(data, dict):
+            data = {key: self.extract(value, fragments) for key, value in data.items()}
+        else:
+            data = self.extract(data, fragments)
+
+        content = super().render(data, accepted_media_type, renderer_context)
+        for placeholder, joined in fragments.items():
+            content = content.replace(f'"{placeholder}"'.encode("ascii"), joined, 1)
+        return content
+
+    def extract(self, value, fragments: dict):
+        if not isinstance(value, FragmentList):
+            return value
+        placeholder = f"fragments-{uuid.uuid4().hex}"
+        fragments[placeholder] = value.joined()
+        return placeholder
+
+
+def cached_fragments(rows, keys, render, backend, timeout) -> tuple:
+    """
+    Fragments of ``rows`` from ``backend``, cached under ``keys`` (one per
+    row). Misses are passed to ``render``, which returns their representations
+    in the same order. Returns the ``FragmentList`` and the number of misses.
+    """
+    cached = backend.get_many(keys)
+    misses = [(row, key) for row, key in zip(rows, keys) if key not in cached]
+    if misses:
+        fresh = render([row for row, _ in misses])
+        fresh_by_key = {
+            key: render_fragment(data) for (_, key), data in zip(misses, fresh)
+        }
+        backend.set_many(fresh_by_key, timeout)
+        cached.update(fresh_by_key)
+    return FragmentList(cached[key] for key in keys), len(misses)
@@ -0,0 +1,162 @@
+"""
+Base class for streaming, resumable bulk import management commands.
+
+Input files (CSV with a header row, or NDJSON) are read record by record, so
+their size is not bounded by memory. Records are written in batches, each in
+its own transaction, which also saves the byte offset reached to an
+``ImportCheckpoint`` row: a batch and its checkpoint are committed together,
+so an interrupted import rerun with the same arguments resumes right after
+the last committed batch, never writing a record twice.
+"""
+import csv
+import json
+import os
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from interview.core.models import ImportCheckpoint
+
+
+class BaseImportCommand(BaseCommand):
+    """
+    Subclasses set ``serializer_class`` and implement ``parse_csv_row`` (turn a
+    CSV row into the item shape the serializer expects) and ``write_batch``.
+    """
+
+    serializer_class = None
+    default_batch_size = 1000
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or NDJSON file to import.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            help="Input format, inferred from the file extension by default.",
+        )
+        parser.add_argument("--batch-size", type=int, default=self.default_batch_size)
+        parser.add_argument(
+            "--checkpoint",
+            help="Checkpoint name, defaults to '<command>:<absolute path>'.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and import from the start.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or self.infer_format(path)
+        batch_size = options["batch_size"]
+        if batch_size <= 0:
+            raise CommandError("--batch-size must be positive.")
+        name = options["checkpoint"] or self.checkpoint_name(path)
+
+        if options["restart"]:
+            ImportCheckpoint.objects.filter(name=name).delete()
+        checkpoint = ImportCheckpoint.objects.filter(name=name).first()
+        if checkpoint is None:
+            checkpoint = ImportCheckpoint(name=name)
+        else:
+            self.stdout.write(f"Resuming after record {checkpoint.records}.")
+
+        self.known = {}
+        serializer = self.serializer_class()
+        started = time.monotonic()
+        created = 0
+
+        with open(path, "rb") as source:
+            records = self.read_records(source, file_format, checkpoint.offset)
+            while True:
+                batch = list(islice(records, batch_size))
+                if not batch:
+                    break
+
+                items = [item for item, _ in batch]
+                first_record = checkpoint.records
+                with transaction.atomic():
+                    batch_created, errors = self.write_batch(items, serializer)
+                    checkpoint.offset = batch[-1][1]
+                    checkpoint.records += len(batch)
+                    checkpoint.created += batch_created
+                    checkpoint.errors += len(errors)
+                    checkpoint.save()
+                for index, detail in errors.items():
+                    self.stderr.write(f"Record {first_record + index + 1}: {detail}")
+                created += batch_created
+
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"{checkpoint.records} records read, "
+                    f"{checkpoint.created} created, "
+                    f"{checkpoint.errors} rejected "
+                    f"({created / elapsed if elapsed else 0:.0f} rows/sec)"
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {checkpoint.created} of {checkpoint.records} "
+                f"records from {path}."
+            )
+        )
+
+    def infer_format(self, path: str) -> str:
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            return "csv"
+        if extension in (".ndjson", ".jsonl"):
+            return "ndjson"
+        raise CommandError(f"Cannot infer the format of {path}, pass --format.")
+
+    def read_records(self, source, file_format: str, offset: int):
+        """Yield ``(item, offset)`` pairs, ``offset`` being the end of the record."""
+        if file_format == "ndjson":
+            source.seek(offset)
+            for line in source:
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    # Passed on as is, the serializer rejects it as a record error.
+                    item = line.decode("utf-8", "replace").strip()
+                yield item, offset
+            return
+
+        header = next(csv.reader([source.readline().decode("utf-8")]), None)
+        if not header:
+            return
+        offset = max(offset, source.tell())
+        source.seek(offset)
+
+        # csv.reader pulls exactly the lines of one record at a time, so the
+        # running offset is a record boundary whenever a row is yielded.
+        position = {"offset": offset}
+
+        def lines():
+            for line in source:
+                position["offset"] += len(line)
+                yield line.decode("utf-8")
+
+        for row in csv.reader(lines()):
+            if row:
+                yield self.parse_csv_row(dict(zip(header, row))), position["offset"]
+
+    def checkpoint_name(self, path: str) -> str:
+        command = self.__module__.rsplit(".", 1)[-1]
+        return f"{command}:{os.path.abspath(path)}"
+
+    def parse_csv_row(self, row: dict) -> dict:
+        raise NotImplementedError
+
+    def write_batch(self, items, serializer) -> tuple[int, dict]:
+        """Write ``items``; return the number created and errors by index."""
+        raise NotImplementedError
+
+
+def split_list(value: str, separator: str = "|") -> list:
+    return [part.strip() for part in value.split(separator) if part.strip()]
@@ -0,0 +1,12 @@
+from interview.core.versions import pinned_versions
+
+
+class PinnedVersionsMiddleware:
+    """Read the version stamps once per request, see ``pinned_versions``."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with pinned_versions():
+            return self.get_response(request)
@@ -0,0 +1,29 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportCheckpoint",
+            fields=[
+                (
+                    "name",
+                    models.CharField(
+                        max_length=1024, primary_key=True, serialize=False
+                    ),
+                ),
+                ("offset", models.BigIntegerField(default=0)),
+                ("records", models.BigIntegerField(default=0)),
+                ("created", models.BigIntegerField(default=0)),
+                ("errors", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
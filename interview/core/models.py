@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class VersionStamp(models.Model):
+    """One version stamp of ``interview.core.versions``."""
+
+    name = models.CharField(max_length=100, primary_key=True)
+    version = models.BigIntegerField()
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.version}"
+
+
+class ImportCheckpoint(models.Model):
+    """
+    Progress of a resumable import (see ``interview.core.importing``), saved in
+    the transaction of each batch.
+    """
+
+    name = models.CharField(max_length=1024, primary_key=True)
+    offset = models.BigIntegerField(default=0)
+    records = models.BigIntegerField(default=0)
+    created = models.BigIntegerField(default=0)
+    errors = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.records} records"
@@ -0,0 +1,57 @@
+"""
+Multi-get endpoints: fetch many rows by id (``?ids=1,2,3``) in one request.
+
+All rows are read with a constant number of queries, results follow the order
+of the requested ids and ids without a row are reported under ``missing``
+rather than failing the request.
+"""
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class MultiGetView(APIView):
+    """
+    Subclasses implement ``get_rows`` (``values()`` rows, with an ``id``, for
+    a list of ids) and ``render`` (representations of such rows).
+    """
+
+    ids_query_param = "ids"
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        ids = self.get_ids(request)
+        rows = {row["id"]: row for row in self.get_rows(ids)}
+        return Response(
+            {
+                "results": self.render([rows[pk] for pk in ids if pk in rows]),
+                "missing": [pk for pk in ids if pk not in rows],
+            },
+            status=200,
+        )
+
+    def get_ids(self, request) -> list:
+        value = request.query_params.get(self.ids_query_param, "")
+        try:
+            ids = [int(pk) for pk in value.split(",") if pk.strip()]
+        except ValueError:
+            raise ValidationError({self.ids_query_param: ["Expected integer ids."]})
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            raise ValidationError(
+                {self.ids_query_param: ["This parameter is required."]}
+            )
+
+        max_ids = settings.MULTI_GET_MAX_IDS
+        if len(ids) > max_ids:
+            raise ValidationError(
+                {self.ids_query_param: [f"At most {max_ids} ids can be requested."]}
+            )
+        return ids
+
+    def get_rows(self, ids):
+        raise NotImplementedError
+
+    def render(self, rows) -> list:
+        raise NotImplementedError
@@ -0,0 +1,299 @@
+import hashlib
+import json
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+EXACT = "exact"
+CACHED = "cached"
+ESTIMATE = "estimate"
+NONE = "none"
+COUNT_STRATEGIES = (EXACT, CACHED, ESTIMATE, NONE)
+
+
+def estimate_count(queryset):
+    """
+    Return the Postgres planner's row estimate for ``queryset``.
+
+    Unfiltered querysets read ``pg_class.reltuples`` for the table, filtered ones
+    use the row estimate of the top ``EXPLAIN`` node. Returns ``None`` when no
+    estimate is available (other database vendors or a never analyzed table).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct and not query.group_by:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            estimate = row[0] if row else None
+        else:
+            sql, params = query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def cached_count(queryset, timeout: int):
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.md5(repr((sql, params)).encode("utf-8")).hexdigest()
+    key = f"pagination:count:{queryset.model._meta.label_lower}:{digest}"
+
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+    return count
+
+
+class CountStrategyPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination with a configurable strategy for the total count.
+
+    - ``exact``: a ``COUNT(*)`` on every request (DRF's default behaviour).
+    - ``cached``: the exact count, cached per query for ``count_cache_timeout``.
+    - ``estimate``: the Postgres planner estimate, falling back to an exact
+      count for small or unanalyzed tables.
+    - ``none``: no count at all; ``has_next`` tells whether another page exists.
+
+    The strategy defaults to ``settings.PAGINATION_COUNT_STRATEGY`` and can be
+    overridden per request with ``?count=<strategy>``. The response envelope
+    reports the strategy used under ``count_strategy``.
+    """
+
+    count_query_param = "count"
+    count_strategy = None
+    count_cache_timeout = None
+    estimate_exact_threshold = 1000
+
+    def get_count_strategy(self, request) -> str:
+        strategy = request.query_params.get(self.count_query_param)
+        if strategy in COUNT_STRATEGIES:
+            return strategy
+        return self.count_strategy or getattr(
+            settings, "PAGINATION_COUNT_STRATEGY", EXACT
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.strategy = self.get_count_strategy(request)
+        if self.strategy == EXACT:
+            self.has_next = None
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.offset = self.get_offset(request)
+        self.count = self.get_count(queryset)
+
+        # Non exact counts cannot bound the page, so look one row ahead instead.
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        self.display_page_controls = self.template is not None and (
+            self.has_next or self.offset > 0
+        )
+        return results[: self.limit]
+
+    def counts_exactly(self, request) -> bool:
+        """
+        Whether the response carries an exact count of the queryset, or the
+        whole queryset when no limit applies: list validators aggregated over
+        the queryset then cost no more than the response itself.
+        """
+        if self.get_limit(request) is None:
+            return True
+        return self.get_count_strategy(request) == EXACT
+
+    def validator_parts(self) -> list:
+        """What a page says about the rest of the queryset, for its ETag."""
+        return [self.count, self.has_next]
+
+    def get_count(self, queryset):
+        if self.strategy == EXACT:
+            return super().get_count(queryset)
+
+        if self.strategy == CACHED:
+            timeout = self.count_cache_timeout or getattr(
+                settings, "PAGINATION_COUNT_CACHE_TIMEOUT", 60
+            )
+            return cached_count(queryset, timeout)
+
+        if self.strategy == ESTIMATE:
+            estimate = estimate_count(queryset)
+            if estimate is None or estimate < self.estimate_exact_threshold:
+                return queryset.count()
+            return estimate
+
+        return None
+
+    def get_next_link(self):
+        if self.has_next is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        offset = self.offset + self.limit
+        return replace_query_param(url, self.offset_query_param, offset)
+
+    def get_html_context(self):
+        if self.count is not None:
+            return super().get_html_context()
+        # Page numbers need a count, the browsable API only gets the neighbours.
+        return {
+            "previous_url": self.get_previous_link(),
+            "next_url": self.get_next_link(),
+            "page_links": [],
+        }
+
+    def get_paginated_response(self, data):
+        envelope = OrderedDict(
+            [
+                ("count", self.count),
+                ("count_strategy", self.strategy),
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+        if self.strategy == NONE:
+            envelope["has_next"] = self.has_next
+        return Response(envelope)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset pagination over the (indexed) fields of ``ordering``.
+
+    ``ordering`` lists the key fields, a ``-`` prefix meaning descending; the
+    last one must be unique. The next page starts right after the key of the
+    last row of the current one, encoded in an opaque cursor, so no
+    ``COUNT(*)`` is issued, rows inserted while a client is paging never shift
+    or duplicate results and, when the key is indexed, each page is a single
+    index range scan whatever its depth.
+    Pages may hold model instances or ``values()`` rows.
+    """
+
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+    default_limit = 10
+    max_limit = 100
+    ordering = ("id",)
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = self.filter_after(queryset, position)
+
+        results = list(queryset[: self.limit + 1])
+        self.has_next = len(results) > self.limit
+        self.page = results[: self.limit]
+        return self.page
+
+    def counts_exactly(self, request) -> bool:
+        return False
+
+    def validator_parts(self) -> list:
+        return [self.has_next]
+
+    def filter_after(self, queryset, position):
+        keys = [(field.lstrip("-"), field.startswith("-")) for field in self.ordering]
+
+        # A bound on the leading field alone keeps this an index range scan.
+        field, descending = keys[0]
+        queryset = queryset.filter(
+            **{f"{field}__{'lte' if descending else 'gte'}": position[0]}
+        )
+
+        after = Q()
+        for index, (field, descending) in enumerate(keys):
+            condition = Q(
+                **{f"{field}__{'lt' if descending else 'gt'}": position[index]}
+            )
+            for (previous, _), value in zip(keys[:index], position):
+                condition &= Q(**{previous: value})
+            after |= condition
+        return queryset.filter(after)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_limit(self, request) -> int:
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        if limit <= 0:
+            return self.default_limit
+        return min(limit, self.max_limit)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        position = [
+            last[field] if isinstance(last, dict) else getattr(last, field)
+            for field in (field.lstrip("-") for field in self.ordering)
+        ]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            self.clean_url(url), self.cursor_query_param, self.encode_cursor(position)
+        )
+
+    def clean_url(self, url: str) -> str:
+        """Hook to drop query parameters that only apply to the first page."""
+        return url
+
+    def encode_cursor(self, position) -> str:
+        values = [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in position
+        ]
+        payload = json.dumps(values).encode("ascii")
+        return b64encode(payload, altchars=b"-_").decode("ascii")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            values = json.loads(b64decode(encoded.encode("ascii"), altchars=b"-_"))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError("Cursor does not match the ordering")
+            return [
+                self.parse_value(field.lstrip("-"), value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def parse_value(self, field: str, value):
+        """Turn a decoded cursor value back into a value of ``field``."""
+        return value
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent by ``IsActiveModel.set_active`` after its bulk ``UPDATE``, which
+# bypasses ``post_save``: ``sender`` is the model and ``pks`` the primary keys
+# of the rows whose ``is_active`` changed.
+active_changed = Signal()
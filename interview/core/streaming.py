@@ -0,0 +1,86 @@
+"""Helpers for streaming large responses without materializing them."""
+import json
+import zlib
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+GZIP_MEDIA_TYPE = "application/gzip"
+STREAM_QUERY_PARAM = "stream"
+STREAM_FORMATS = ("json", "ndjson")
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Lets views that stream NDJSON pass content negotiation. Streamed bodies
+    bypass renderers, so this only renders regular responses (e.g. errors) as a
+    single JSON line.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return ndjson_line(data)
+
+
+def ndjson_line(data) -> bytes:
+    return json.dumps(data, cls=JSONEncoder, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def gzip_stream(chunks, level: int = 6):
+    """Gzip an iterable of byte strings incrementally."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def render_chunks(rows, render, chunk_size: int):
+    """
+    Representations of the queryset ``rows``, read through a server-side
+    cursor and passed to ``render`` ``chunk_size`` rows at a time.
+    """
+    rows = rows.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield from render(chunk)
+
+
+def json_array_stream(items):
+    """Encode ``items`` as a single JSON array, one item at a time."""
+    separator = b"["
+    for data in items:
+        yield separator + json.dumps(data, cls=JSONEncoder).encode("utf-8")
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+def get_stream_format(request):
+    """The ``?stream=`` format of a request, ``None`` for a regular response."""
+    stream = request.query_params.get(STREAM_QUERY_PARAM)
+    if stream is not None and stream not in STREAM_FORMATS:
+        expected = ", ".join(STREAM_FORMATS)
+        raise ValidationError({STREAM_QUERY_PARAM: [f"Expected one of {expected}."]})
+    return stream
+
+
+def streaming_response(items, stream: str) -> StreamingHttpResponse:
+    """Stream the representations ``items`` as a JSON array or as NDJSON."""
+    if stream == "ndjson":
+        lines = (ndjson_line(data) for data in items)
+        return StreamingHttpResponse(lines, content_type=NDJSON_MEDIA_TYPE)
+    return StreamingHttpResponse(
+        json_array_stream(items), content_type="application/json"
+    )
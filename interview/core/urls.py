@@ -0,0 +1,7 @@
+from django.urls import path
+from interview.core.views import VocabularyBundleView
+
+
+urlpatterns = [
+    path("", VocabularyBundleView.as_view(), name="vocabulary-bundle"),
+]
@@ -0,0 +1,79 @@
+"""
+Version stamps shared by every worker through the ``VersionStamp`` table.
+
+A version is the wall clock in nanoseconds at the last bump (or at least one
+more than the previous version), so it doubles as the time of the last change
+and never goes backwards. Bumps are written in the transaction of the change
+they announce, so other workers see the new stamp exactly when they can see
+the new rows; concurrent bumps of one stamp wait on its row lock.
+
+Inside ``pinned_versions()`` (every request, see
+``interview.core.middleware``) all stamps are read with one query on first
+use and kept for the rest of the scope; elsewhere every read is a query.
+Reads never write: a stamp that was never bumped has ``UNSET_VERSION``.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
+
+from django.db.models import BigIntegerField, F, Value
+from django.db.models.functions import Greatest
+
+from interview.core.models import VersionStamp
+
+# The version of a stamp without a row, older than any bump.
+UNSET_VERSION = 0
+
+_pinned: ContextVar[Optional[dict]] = ContextVar("pinned_versions", default=None)
+
+
+@contextmanager
+def pinned_versions():
+    """Read every stamp at most once within the block."""
+    token = _pinned.set({})
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+def get_version(name: str) -> int:
+    pinned = _pinned.get()
+    if pinned is None:
+        return read_version(name)
+    if not pinned:
+        # The empty key marks the stamps as loaded, even if there are none.
+        pinned[""] = 0
+        pinned.update(VersionStamp.objects.values_list("name", "version"))
+    return pinned.get(name, UNSET_VERSION)
+
+
+def read_version(name: str) -> int:
+    stamps = VersionStamp.objects.filter(name=name)
+    version = stamps.values_list("version", flat=True).first()
+    return UNSET_VERSION if version is None else version
+
+
+def bump_version(name: str) -> int:
+    stamps = VersionStamp.objects.filter(name=name)
+    next_version = Greatest(
+        F("version") + 1, Value(time.time_ns(), output_field=BigIntegerField())
+    )
+    if not stamps.update(version=next_version):
+        _, created = VersionStamp.objects.get_or_create(
+            name=name, defaults={"version": time.time_ns()}
+        )
+        if not created:
+            stamps.update(version=next_version)
+    version = stamps.values_list("version", flat=True).get()
+
+    pinned = _pinned.get()
+    if pinned:
+        pinned[name] = version
+    return version
+
+
+def version_datetime(version: int) -> datetime:
+    return datetime.fromtimestamp(version / 1e9, tz=timezone.utc)
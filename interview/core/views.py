@@ -1,3 +1,30 @@
-from django.shortcuts import render
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.http import quote_etag
+from rest_framework.request import Request
+from rest_framework.views import APIView
 
-# Create your views here.
+from interview.core import conditional
+from interview.core.vocabulary import get_bundle
+
+
+class VocabularyBundleView(APIView):
+    """
+    Every vocabulary (inventory types, languages and tags, order tags) in one
+    response, served as a precomputed blob whose content hash is the ETag.
+    """
+
+    def get(self, request: Request, *args, **kwargs) -> HttpResponse:
+        bundle = get_bundle()
+        validators = conditional.Validators(
+            quote_etag(bundle.digest), int(bundle.last_modified.timestamp())
+        )
+        response = conditional.not_modified(request, validators)
+        if response is None:
+            response = HttpResponse(bundle.content, content_type="application/json")
+            conditional.set_validators(response, validators)
+        patch_cache_control(
+            response, public=True, max_age=settings.VOCABULARY_BUNDLE_MAX_AGE
+        )
+        return response
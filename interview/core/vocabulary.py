@@ -0,0 +1,167 @@
+"""
+Per-process cache of small, rarely changing vocabulary tables.
+
+A registered model is held in memory as ``id -> row`` and ``name -> row`` maps
+of its field values. Every lookup first reads the model's version stamp from
+``interview.core.versions`` (read once per request) and reloads the whole
+table when it moved; bumping the stamp on writes therefore retires the copy
+held by every worker, and reads do not join or query the vocabulary table.
+Rows missing from the copy reload it once and are then read from the table,
+so a lookup never fails on a row newer than the copy.
+
+Vocabularies registered with a ``bundle_name`` are also served together by
+``interview.core.views.VocabularyBundleView`` from a precomputed blob.
+"""
+import hashlib
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+from interview.core.versions import get_version, version_datetime
+
+_registry = {}
+
+
+class Snapshot(NamedTuple):
+    version: Optional[int]
+    by_id: dict
+    by_name: dict
+
+
+class Vocabulary:
+    """
+    Cached rows of ``model``, kept current by the ``version`` stamp. Rows are
+    shared between readers and must not be mutated.
+    """
+
+    def __init__(self, model, version: str, bundle_name=None, bundle_fields=None):
+        self.model = model
+        self.version = version
+        self.fields = [field.attname for field in model._meta.concrete_fields]
+        self.bundle_name = bundle_name
+        self.bundle_fields = bundle_fields or ("id", "name")
+        self.snapshot = Snapshot(None, {}, {})
+
+    def load(self, force: bool = False) -> Snapshot:
+        version = get_version(self.version)
+        snapshot = self.snapshot
+        if force or snapshot.version != version:
+            # The version is read before the rows: a bump racing with the load
+            # leaves an older version on the snapshot and the next read reloads.
+            rows = self.model._default_manager.order_by("pk").values(*self.fields)
+            by_id = {row["id"]: row for row in rows}
+            by_name = {row["name"]: row for row in by_id.values()}
+            snapshot = self.snapshot = Snapshot(version, by_id, by_name)
+        return snapshot
+
+    def get_many(self, pks) -> dict:
+        """
+        Rows of ``pks`` by id, ids without a row being left out. Ids missing
+        from the snapshot (referenced rows are newer than it) reload it once,
+        then are read from the table.
+        """
+        pks = set(pks)
+        rows = self.load().by_id
+        found = {pk: rows[pk] for pk in pks if pk in rows}
+        missing = pks.difference(found)
+        if missing:
+            rows = self.load(force=True).by_id
+            found.update((pk, rows[pk]) for pk in missing if pk in rows)
+            found.update(self.read("id", missing.difference(found)))
+        return found
+
+    def get(self, pk) -> Optional[dict]:
+        return self.get_many([pk]).get(pk)
+
+    def get_by_name(self, name: str) -> Optional[dict]:
+        return self.get_many_by_name([name]).get(name)
+
+    def ids_by_name(self, names) -> dict:
+        rows = self.get_many_by_name(names)
+        return {name: row["id"] for name, row in rows.items()}
+
+    def get_many_by_name(self, names) -> dict:
+        """
+        Rows of ``names`` by name; names missing from the snapshot are read
+        from the table, as unknown names are common and must not reload it.
+        """
+        names = set(names)
+        rows = self.load().by_name
+        found = {name: rows[name] for name in names if name in rows}
+        found.update(self.read("name", names.difference(found)))
+        return found
+
+    def read(self, field: str, keys: set) -> dict:
+        if not keys:
+            return {}
+        rows = self.model._default_manager.filter(**{f"{field}__in": keys})
+        return {row[field]: row for row in rows.values(*self.fields)}
+
+    def instance(self, row: dict):
+        """An unmodified model instance built from a cached ``row``."""
+        return self.model.from_db(
+            self.model._default_manager.db,
+            self.fields,
+            [row[field] for field in self.fields],
+        )
+
+    def bundle_rows(self) -> list:
+        return [
+            {field: row[field] for field in self.bundle_fields}
+            for row in self.load().by_id.values()
+        ]
+
+
+def register(model, version: str, bundle_name=None, bundle_fields=None):
+    """
+    Cache ``model``, whose writers bump the ``version`` stamp. With a
+    ``bundle_name`` its ``bundle_fields`` are part of the vocabulary bundle.
+    """
+    vocabulary = _registry[model] = Vocabulary(
+        model, version, bundle_name, bundle_fields
+    )
+    return vocabulary
+
+
+def get_vocabulary(model) -> Optional[Vocabulary]:
+    return _registry.get(model)
+
+
+class Bundle(NamedTuple):
+    digest: str
+    content: bytes
+    last_modified: datetime
+
+
+def get_bundle() -> Bundle:
+    """
+    Every bundled vocabulary as one JSON document with its content hash.
+
+    The rendered document is stored in the default cache under the current
+    version stamps, so it is regenerated once per vocabulary change (and per
+    cache, when that is local to a worker) rather than per request.
+    """
+    bundled = sorted(
+        (vocabulary for vocabulary in _registry.values() if vocabulary.bundle_name),
+        key=lambda vocabulary: vocabulary.bundle_name,
+    )
+    versions = [get_version(vocabulary.version) for vocabulary in bundled]
+    key = f"vocabulary:bundle:{':'.join(map(str, versions))}"
+
+    bundle = cache.get(key)
+    if bundle is None:
+        renderer = JSONRenderer()
+        data = {
+            vocabulary.bundle_name: vocabulary.bundle_rows() for vocabulary in bundled
+        }
+        digest = hashlib.sha1(renderer.render(data)).hexdigest()
+        bundle = Bundle(
+            digest,
+            renderer.render({"hash": digest, "vocabularies": data}),
+            max(map(version_datetime, versions)),
+        )
+        cache.set(key, bundle, settings.VOCABULARY_BUNDLE_TIMEOUT)
+    return bundle
@@ -4,3 +4,24 @@ from django.apps import AppConfig
 class InventoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "interview.inventory"
+
+    def ready(self):
+        from interview.core import vocabulary
+        from interview.inventory import signals  # noqa: F401
+        from interview.inventory.cache import VOCABULARY_VERSION
+        from interview.inventory.models import (
+            InventoryLanguage,
+            InventoryTag,
+            InventoryType,
+        )
+
+        vocabulary.register(InventoryType, VOCABULARY_VERSION, "inventory_types")
+        vocabulary.register(
+            InventoryLanguage, VOCABULARY_VERSION, "inventory_languages"
+        )
+        vocabulary.register(
+            InventoryTag,
+            VOCABULARY_VERSION,
+            "inventory_tags",
+            ("id", "name", "is_active"),
+        )
@@ -0,0 +1,115 @@
+"""
+Set-based inventory writes shared by the batch endpoint and the importers.
+
+Vocabulary names are resolved with one query per vocabulary and rows are
+written with ``bulk_create`` for both ``Inventory`` and its tags through table.
+"""
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from interview.core.vocabulary import get_vocabulary
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.inventory.representations import refresh_documents
+
+
+def resolve_names(model, names, known=None) -> dict:
+    """
+    Map the existing ``names`` of ``model`` to their ids, in a single query,
+    or none for models cached by ``interview.core.vocabulary``.
+
+    ``known`` is an optional ``{model: {name: id}}`` dict kept across calls by
+    long running writers; only names missing from it are looked up.
+    """
+    vocabulary = get_vocabulary(model)
+    if vocabulary is not None:
+        return vocabulary.ids_by_name(names)
+
+    known = {} if known is None else known.setdefault(model, {})
+    missing = set(names).difference(known)
+    if missing:
+        known.update(model.objects.filter(name__in=missing).values_list("name", "id"))
+    return known
+
+
+def validate_items(items, serializer, known=None) -> tuple[dict, dict]:
+    """
+    Validate ``items`` with ``serializer`` and resolve their vocabulary names.
+
+    Returns ``(valid, errors)``, both keyed by the index of the item: valid
+    entries are unsaved ``Inventory`` instances carrying their tag ids in
+    ``tag_ids``, errors are DRF error details. See ``resolve_names`` for
+    ``known``.
+    """
+    validated, errors = {}, {}
+    for index, item in enumerate(items):
+        try:
+            validated[index] = serializer.run_validation(item)
+        except ValidationError as e:
+            errors[index] = e.detail
+
+    values = validated.values()
+    types = resolve_names(InventoryType, [item["type"] for item in values], known)
+    languages = resolve_names(
+        InventoryLanguage, [item["language"] for item in values], known
+    )
+    tags = resolve_names(
+        InventoryTag, [tag for item in values for tag in item["tags"]], known
+    )
+
+    valid = {}
+    for index, item in validated.items():
+        item_errors = {}
+        if item["type"] not in types:
+            item_errors["type"] = [f"Unknown inventory type '{item['type']}'."]
+        if item["language"] not in languages:
+            item_errors["language"] = [
+                f"Unknown inventory language '{item['language']}'."
+            ]
+        unknown_tags = [tag for tag in item["tags"] if tag not in tags]
+        if unknown_tags:
+            item_errors["tags"] = [
+                f"Unknown inventory tag '{tag}'." for tag in unknown_tags
+            ]
+        if item_errors:
+            errors[index] = item_errors
+            continue
+
+        inventory = Inventory(
+            name=item["name"],
+            type_id=types[item["type"]],
+            language_id=languages[item["language"]],
+            metadata=item["metadata"],
+        )
+        inventory.tag_ids = list(dict.fromkeys(tags[tag] for tag in item["tags"]))
+        valid[index] = inventory
+
+    return valid, dict(sorted(errors.items()))
+
+
+def create_inventories(inventories, batch_size=None) -> list:
+    """
+    Insert ``inventories`` (see ``validate_items``) and their tag links in one
+    transaction with two ``bulk_create`` calls, then store their documents,
+    which ``bulk_create`` does not signal. Returns the saved instances.
+    """
+    inventories = list(inventories)
+    through = Inventory.tags.through
+    with transaction.atomic():
+        Inventory.objects.bulk_create(inventories, batch_size=batch_size)
+        through.objects.bulk_create(
+            [
+                through(inventory_id=inventory.id, inventorytag_id=tag_id)
+                for inventory in inventories
+                for tag_id in inventory.tag_ids
+            ],
+            batch_size=batch_size,
+        )
+        refresh_documents(
+            Inventory.objects.filter(pk__in=[inventory.pk for inventory in inventories])
+        )
+    return inventories
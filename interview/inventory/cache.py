@@ -0,0 +1,93 @@
+"""
+Read-through cache of inventory representations, as JSON fragments (see
+``interview.core.fragments``).
+
+Entries are keyed by the inventory id and its ``updated_at`` plus a generation
+number. Saving an inventory or changing its tags moves ``updated_at`` forward,
+so stale entries are simply never read again, while changes to the shared
+vocabularies (types, languages and tags) bump the generation and retire every
+entry at once. The receivers in ``interview.inventory.signals`` drive both.
+"""
+from django.conf import settings
+from django.core.cache import caches
+
+from interview.core.fragments import FragmentList, cached_fragments
+from interview.core.versions import bump_version, get_version
+
+VOCABULARY_VERSION = "inventory-vocabulary"
+HITS_KEY = "inventory:repr:hits"
+MISSES_KEY = "inventory:repr:misses"
+
+
+def get_cache():
+    return caches[getattr(settings, "INVENTORY_CACHE_ALIAS", "default")]
+
+
+def get_timeout():
+    return getattr(settings, "INVENTORY_CACHE_TIMEOUT", 300)
+
+
+def get_generation() -> int:
+    return get_version(VOCABULARY_VERSION)
+
+
+def bump_generation() -> None:
+    bump_version(VOCABULARY_VERSION)
+
+
+def representation_key(generation: int, pk: int, updated_at) -> str:
+    return f"inventory:repr:{generation}:{pk}:{updated_at.timestamp()}"
+
+
+def invalidate(instances) -> None:
+    generation = get_generation()
+    get_cache().delete_many(
+        [representation_key(generation, obj.pk, obj.updated_at) for obj in instances]
+    )
+
+
+def increment(key: str, delta: int) -> None:
+    if not delta:
+        return
+    backend = get_cache()
+    backend.add(key, 0, None)
+    try:
+        backend.incr(key, delta)
+    except ValueError:
+        backend.set(key, delta, None)
+
+
+def stats() -> dict:
+    counters = get_cache().get_many([HITS_KEY, MISSES_KEY])
+    hits = counters.get(HITS_KEY, 0)
+    misses = counters.get(MISSES_KEY, 0)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else None,
+    }
+
+
+def reset_stats() -> None:
+    get_cache().delete_many([HITS_KEY, MISSES_KEY])
+
+
+def serialize(rows, render) -> FragmentList:
+    """
+    Return the representations of ``rows``, in order, as JSON fragments.
+
+    ``rows`` are ``values()`` rows carrying at least ``id`` and ``updated_at``.
+    Cached representations are reused and only the misses are passed to
+    ``render``, which returns their representations in the same order.
+    """
+    rows = list(rows)
+    generation = get_generation()
+    keys = [
+        representation_key(generation, row["id"], row["updated_at"]) for row in rows
+    ]
+    fragments, misses = cached_fragments(rows, keys, render, get_cache(), get_timeout())
+
+    increment(HITS_KEY, len(rows) - misses)
+    increment(MISSES_KEY, misses)
+    return fragments
@@ -0,0 +1,27 @@
+import json
+
+from interview.core.importing import BaseImportCommand, split_list
+from interview.inventory import batch
+from interview.inventory.serializers import InventoryBatchItemSerializer
+
+
+class Command(BaseImportCommand):
+    help = (
+        "Bulk import inventories from CSV (columns: name, type, language, tags "
+        "separated by '|', metadata as JSON) or NDJSON (one batch create item "
+        "per line)."
+    )
+    serializer_class = InventoryBatchItemSerializer
+
+    def parse_csv_row(self, row: dict) -> dict:
+        item = dict(row, tags=split_list(row.get("tags", "")))
+        try:
+            item["metadata"] = json.loads(row.get("metadata") or "null")
+        except ValueError:
+            pass
+        return item
+
+    def write_batch(self, items, serializer) -> tuple[int, dict]:
+        valid, errors = batch.validate_items(items, serializer, self.known)
+        created = batch.create_inventories(valid.values())
+        return len(created), errors
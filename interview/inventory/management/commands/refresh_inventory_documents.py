@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.inventory.models import Inventory
+from interview.inventory.representations import refresh_documents, stale_documents
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-render the stored inventory documents, e.g. to backfill them after "
+        "the table was created or after writes that bypassed the signals. With "
+        "--stale, only the missing ones and those older than their inventory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--stale",
+            action="store_true",
+            help="Only re-render missing or outdated documents.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size <= 0:
+            raise CommandError("--chunk-size must be positive.")
+
+        inventories = Inventory.objects.all()
+        if options["stale"]:
+            inventories = stale_documents(inventories)
+        refreshed = refresh_documents(inventories, chunk_size)
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {refreshed} inventory documents.")
+        )
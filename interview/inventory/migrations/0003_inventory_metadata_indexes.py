@@ -0,0 +1,46 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:14
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.fields.json
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0002_inventory_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["metadata"],
+                name="inventory_metadata_gin_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                django.db.models.fields.json.KeyTransform("year", "metadata"),
+                name="inventory_metadata_year_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                django.db.models.fields.json.KeyTransform("imdb_rating", "metadata"),
+                name="inventory_metadata_imdb_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                django.db.models.fields.json.KeyTransform(
+                    "rotten_tomatoes_rating", "metadata"
+                ),
+                name="inventory_metadata_rt_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:16
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Keeps ``search_vector`` in step with ``name`` and ``metadata.actors`` on every
+# write path, including bulk_create and queryset updates.
+CREATE_TRIGGER = """
+CREATE FUNCTION inventory_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+        setweight(
+            to_tsvector(
+                'simple',
+                CASE
+                    WHEN jsonb_typeof(NEW.metadata -> 'actors') = 'array' THEN
+                        coalesce((
+                            SELECT string_agg(actor, ' ')
+                            FROM jsonb_array_elements_text(NEW.metadata -> 'actors')
+                                AS actor
+                        ), '')
+                    ELSE ''
+                END
+            ),
+            'B'
+        );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER inventory_search_vector_trigger
+BEFORE INSERT OR UPDATE OF name, metadata ON inventory_inventory
+FOR EACH ROW EXECUTE FUNCTION inventory_search_vector_update();
+
+UPDATE inventory_inventory SET name = name;
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS inventory_search_vector_trigger ON inventory_inventory;
+DROP FUNCTION IF EXISTS inventory_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0003_inventory_metadata_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="inventory",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="inventory_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="inventory_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:18
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0004_inventory_search"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="text_pattern_ops",
+                ),
+                name="inventory_name_prefix_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventorylanguage",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="text_pattern_ops",
+                ),
+                name="inventory_language_prefix_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventorytag",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="text_pattern_ops",
+                ),
+                name="inventory_tag_prefix_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventorytype",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="text_pattern_ops",
+                ),
+                name="inventory_type_prefix_idx",
+            ),
+        ),
+    ]
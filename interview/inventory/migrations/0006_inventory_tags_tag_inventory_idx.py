@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Composite index on the auto-created tags through table, leading with the
+    tag so the inventories of a tag are read from the index alone.
+    """
+
+    dependencies = [
+        ("inventory", "0005_name_prefix_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX inventory_tags_tag_inventory_idx "
+            "ON inventory_inventory_tags (inventorytag_id, inventory_id);",
+            "DROP INDEX IF EXISTS inventory_tags_tag_inventory_idx;",
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0006_inventory_tags_tag_inventory_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InventoryDocument",
+            fields=[
+                (
+                    "inventory",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="document",
+                        serialize=False,
+                        to="inventory.inventory",
+                    ),
+                ),
+                ("document", models.JSONField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name_plural": "Inventory Documents",
+            },
+        ),
+    ]
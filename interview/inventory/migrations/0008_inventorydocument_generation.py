@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0007_inventory_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inventorydocument",
+            name="generation",
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:53
+
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    # The new indexes are built before the old ones go, both concurrently.
+    atomic = False
+
+    dependencies = [
+        ("inventory", "0008_inventorydocument_generation"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="inventory",
+            index=models.Index(
+                django.db.models.functions.comparison.Collate(
+                    django.db.models.functions.text.Upper("name"), "C"
+                ),
+                models.F("id"),
+                name="inventory_name_upper_c_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inventorylanguage",
+            index=models.Index(
+                django.db.models.functions.comparison.Collate(
+                    django.db.models.functions.text.Upper("name"), "C"
+                ),
+                models.F("id"),
+                name="inventory_language_upper_c_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inventorytag",
+            index=models.Index(
+                django.db.models.functions.comparison.Collate(
+                    django.db.models.functions.text.Upper("name"), "C"
+                ),
+                models.F("id"),
+                name="inventory_tag_upper_c_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="inventorytype",
+            index=models.Index(
+                django.db.models.functions.comparison.Collate(
+                    django.db.models.functions.text.Upper("name"), "C"
+                ),
+                models.F("id"),
+                name="inventory_type_upper_c_idx",
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="inventory",
+            name="inventory_name_prefix_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="inventorylanguage",
+            name="inventory_language_prefix_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="inventorytag",
+            name="inventory_tag_prefix_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="inventorytype",
+            name="inventory_type_prefix_idx",
+        ),
+    ]
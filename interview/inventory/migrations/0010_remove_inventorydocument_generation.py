@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-18 21:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0009_name_prefix_c_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="inventorydocument",
+            name="generation",
+        ),
+    ]
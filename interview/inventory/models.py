@@ -1,5 +1,9 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.fields.json import KeyTransform
 
+from interview.core.autocomplete import prefix_index
 from interview.core.behaviors import (
     IsActiveModel,
     NameModel,
@@ -9,6 +13,9 @@ from interview.core.behaviors import (
 
 
 class InventoryTag(UniqueNameModel, TimestampedModel, IsActiveModel, models.Model):
+    class Meta:
+        indexes = [prefix_index("inventory_tag_upper_c_idx")]
+
     def __str__(self) -> str:
         return self.name
 
@@ -16,6 +23,7 @@ class InventoryTag(UniqueNameModel, TimestampedModel, IsActiveModel, models.Mode
 class InventoryLanguage(UniqueNameModel, TimestampedModel, models.Model):
     class Meta:
         verbose_name_plural = "Inventory Languages"
+        indexes = [prefix_index("inventory_language_upper_c_idx")]
 
     def __str__(self) -> str:
         return self.name
@@ -24,6 +32,7 @@ class InventoryLanguage(UniqueNameModel, TimestampedModel, models.Model):
 class InventoryType(UniqueNameModel, TimestampedModel, models.Model):
     class Meta:
         verbose_name_plural = "Inventory Types"
+        indexes = [prefix_index("inventory_type_upper_c_idx")]
 
     def __str__(self) -> str:
         return self.name
@@ -38,9 +47,42 @@ class Inventory(NameModel, TimestampedModel, models.Model):
     )
     tags = models.ManyToManyField(InventoryTag, related_name="inventories")
     metadata = models.JSONField()
+    # Weighted tsvector of the name (A) and metadata actors (B), maintained by
+    # a database trigger (see migration 0004) so bulk writes keep it current.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name_plural = "Inventories"
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"], name="inventory_created_at_id_idx"
+            ),
+            # Containment (@>) filters on metadata, e.g. by actor.
+            GinIndex(
+                fields=["metadata"],
+                opclasses=["jsonb_path_ops"],
+                name="inventory_metadata_gin_idx",
+            ),
+            # Range filters on single metadata keys.
+            models.Index(
+                KeyTransform("year", "metadata"), name="inventory_metadata_year_idx"
+            ),
+            models.Index(
+                KeyTransform("imdb_rating", "metadata"),
+                name="inventory_metadata_imdb_idx",
+            ),
+            models.Index(
+                KeyTransform("rotten_tomatoes_rating", "metadata"),
+                name="inventory_metadata_rt_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="inventory_search_vector_idx"),
+            GinIndex(
+                fields=["name"],
+                opclasses=["gin_trgm_ops"],
+                name="inventory_name_trgm_idx",
+            ),
+            prefix_index("inventory_name_upper_c_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -52,3 +94,24 @@ class Inventory(NameModel, TimestampedModel, models.Model):
     @classmethod
     def get_by_language(cls, language_id: int):
         return cls.objects.filter(language_id=language_id)
+
+
+class InventoryDocument(models.Model):
+    """
+    Denormalized read model: the rendered API representation of an inventory,
+    kept current by ``interview.inventory.representations.refresh_documents``
+    from the receivers in ``interview.inventory.signals``.
+    """
+
+    inventory = models.OneToOneField(
+        Inventory, on_delete=models.CASCADE, primary_key=True, related_name="document"
+    )
+    document = models.JSONField()
+    # ``Inventory.updated_at`` at rendering time; a mismatch marks it stale.
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name_plural = "Inventory Documents"
+
+    def __str__(self) -> str:
+        return f"Document of inventory {self.inventory_id}"
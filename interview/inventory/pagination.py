@@ -1,5 +1,58 @@
-from rest_framework.pagination import LimitOffsetPagination
+from django.utils.dateparse import parse_datetime
+from rest_framework.utils.urls import remove_query_param
 
-class InventoryPagination(LimitOffsetPagination):
+from interview.core.pagination import CountStrategyPagination, KeysetPagination
+
+
+class InventoryPagination(CountStrategyPagination):
     default_limit = 3
-    max_limit = 100
\ No newline at end of file
+    max_limit = 100
+
+
+class InventoryCursorPagination(KeysetPagination):
+    """
+    Keyset pagination over the indexed ``(created_at, id)`` key, enabled with
+    ``?pagination=cursor`` and continued with the ``cursor`` of ``next``.
+    """
+
+    mode_query_param = "pagination"
+    mode_query_value = "cursor"
+    default_limit = InventoryPagination.default_limit
+    max_limit = InventoryPagination.max_limit
+    ordering = ("created_at", "id")
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        return (
+            cls.cursor_query_param in request.query_params
+            or request.query_params.get(cls.mode_query_param) == cls.mode_query_value
+        )
+
+    def clean_url(self, url: str) -> str:
+        return remove_query_param(url, self.mode_query_param)
+
+    def parse_value(self, field: str, value):
+        if field == "created_at":
+            created_at = parse_datetime(value)
+            if created_at is None:
+                raise ValueError("Invalid created_at")
+            return created_at
+        return int(value)
+
+
+class InventorySearchPagination(KeysetPagination):
+    """
+    Keyset pagination over the ``(rank, id)`` key of search results. The rank
+    is computed, not indexed: every page ranks the matching rows again and
+    keeps those after the cursor, so it spares the client an offset but not
+    the database the ranking.
+    """
+
+    default_limit = 20
+    max_limit = InventoryPagination.max_limit
+    ordering = ("-rank", "id")
+
+    def parse_value(self, field: str, value):
+        if field == "rank":
+            return float(value)
+        return int(value)
@@ -0,0 +1,211 @@
+"""
+Lean, read-only rendering of inventories from ``values()`` rows.
+
+Produces exactly the JSON shape of ``InventorySerializer`` without instantiating
+models or serializer fields, which dominates the cost of list endpoints. Types,
+languages and tags are read from ``interview.core.vocabulary`` rather than
+joined. ``interview.inventory.tests`` asserts the output is byte-for-byte
+identical.
+
+Full representations are read from the denormalized ``InventoryDocument``
+table, a single primary key lookup per page. ``store_documents`` and
+``refresh_documents`` keep it current and are driven by the receivers in
+``interview.inventory.signals``: inventory writes store their documents in
+the same transaction, vocabulary changes re-render the documents embedding
+the changed row in chunks after commit. Sparse fieldsets (see
+``interview.core.fieldsets``) are rendered from the source tables instead,
+skipping the columns and the tags query of fields that are not requested.
+"""
+from collections import defaultdict
+from itertools import islice
+
+from django.db.models import Exists, OuterRef
+
+from interview.core.fieldsets import Fieldset
+from interview.core.vocabulary import get_vocabulary
+from interview.inventory import cache
+from interview.inventory.models import (
+    Inventory,
+    InventoryDocument,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+
+INVENTORY_VALUES = (
+    "id",
+    "name",
+    "type_id",
+    "language_id",
+    "metadata",
+    "created_at",
+    "updated_at",
+)
+# Columns read only when the field of the same name is requested.
+DEFERRABLE_VALUES = ("name", "metadata")
+
+INVENTORY_FIELDS = ("id", "name", "type", "language", "tags", "metadata")
+INVENTORY_RELATIONS = ("type", "language", "tags")
+
+
+def inventory_fieldset(request) -> Fieldset:
+    return Fieldset.from_request(request, INVENTORY_FIELDS, INVENTORY_RELATIONS)
+
+
+def inventory_values(queryset, fieldset=None):
+    if fieldset is None:
+        return queryset.values(*INVENTORY_VALUES)
+    return queryset.values(
+        *(
+            column
+            for column in INVENTORY_VALUES
+            if column not in DEFERRABLE_VALUES or column in fieldset
+        )
+    )
+
+
+def tags_by_inventory(inventory_ids) -> dict:
+    """Tag representations of each inventory, in tag id order, in one query."""
+    rows = list(
+        Inventory.tags.through.objects.filter(inventory_id__in=inventory_ids)
+        .order_by("inventorytag_id")
+        .values_list("inventory_id", "inventorytag_id")
+    )
+    vocabulary = get_vocabulary(InventoryTag).get_many(tag_id for _, tag_id in rows)
+    tags = defaultdict(list)
+    for inventory_id, tag_id in rows:
+        tag = vocabulary.get(tag_id)
+        if tag is None:
+            # Deleted since the links were read.
+            continue
+        tags[inventory_id].append(
+            {"id": tag_id, "name": tag["name"], "is_active": tag["is_active"]}
+        )
+    return tags
+
+
+def render_inventory(row, tags, types, languages) -> dict:
+    """Render a ``values()`` row; ``types`` and ``languages`` map ids to rows."""
+    return {
+        "id": row["id"],
+        "name": row.get("name"),
+        "type": {"id": row["type_id"], "name": types[row["type_id"]]["name"]},
+        "language": {
+            "id": row["language_id"],
+            "name": languages[row["language_id"]]["name"],
+        },
+        "tags": tags,
+        "metadata": row.get("metadata"),
+    }
+
+
+def build_inventories(rows, fieldset=None) -> list:
+    """Render ``values()`` rows from the source tables."""
+    rows = list(rows)
+    if fieldset is None or "tags" in fieldset:
+        tags = tags_by_inventory([row["id"] for row in rows])
+    else:
+        tags = {}
+    types = get_vocabulary(InventoryType).get_many(row["type_id"] for row in rows)
+    languages = get_vocabulary(InventoryLanguage).get_many(
+        row["language_id"] for row in rows
+    )
+    data = [
+        render_inventory(row, tags.get(row["id"], []), types, languages) for row in rows
+    ]
+    if fieldset is None or fieldset.complete:
+        return data
+    return [fieldset.project(item) for item in data]
+
+
+def render_inventories(rows, fieldset=None) -> list:
+    rows = list(rows)
+    if fieldset is None or fieldset.complete:
+        return stored_inventories(rows)
+    return build_inventories(rows, fieldset)
+
+
+def stored_inventories(rows) -> list:
+    """
+    Full representations of ``values()`` rows from their stored documents.
+    Missing documents, or documents older than their inventory (written with
+    ``queryset.update()`` for instance), are rendered from the source tables
+    instead; reads never write documents.
+    """
+    stored = {
+        inventory_id: (updated_at, document)
+        for inventory_id, updated_at, document in InventoryDocument.objects.filter(
+            inventory_id__in=[row["id"] for row in rows]
+        ).values_list("inventory_id", "updated_at", "document")
+    }
+    stale = [
+        row
+        for row in rows
+        if row["id"] not in stored or stored[row["id"]][0] != row["updated_at"]
+    ]
+    if stale:
+        for row, document in zip(stale, build_inventories(stale)):
+            stored[row["id"]] = (row["updated_at"], document)
+
+    # jsonb does not keep the key order of the representation.
+    return [
+        {field: stored[row["id"]][1][field] for field in INVENTORY_FIELDS}
+        for row in rows
+    ]
+
+
+def store_documents(rows) -> list:
+    """Render full ``values()`` rows and upsert them as documents."""
+    documents = build_inventories(rows)
+    InventoryDocument.objects.bulk_create(
+        [
+            InventoryDocument(
+                inventory_id=row["id"],
+                document=document,
+                updated_at=row["updated_at"],
+            )
+            for row, document in zip(rows, documents)
+        ],
+        update_conflicts=True,
+        unique_fields=["inventory_id"],
+        update_fields=["document", "updated_at"],
+    )
+    return documents
+
+
+def refresh_documents(queryset, chunk_size=1000) -> int:
+    """Re-render the documents of the inventories of ``queryset``, in chunks."""
+    rows = inventory_values(queryset.order_by("pk")).iterator(chunk_size=chunk_size)
+    refreshed = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return refreshed
+        store_documents(chunk)
+        refreshed += len(chunk)
+
+
+def stale_documents(queryset):
+    """
+    The inventories of ``queryset`` without a current document: missing or
+    older than the inventory.
+    """
+    current = InventoryDocument.objects.filter(
+        inventory=OuterRef("pk"), updated_at=OuterRef("updated_at")
+    )
+    return queryset.filter(~Exists(current))
+
+
+def cached_inventories(rows) -> list:
+    """``render_inventories`` through the representation cache."""
+    return cache.serialize(rows, render_inventories)
+
+
+def inventory_representations(rows, fieldset: Fieldset) -> list:
+    """
+    The full representation comes from the cache; sparse ones are cheap to
+    render from their narrowed rows and are not cached.
+    """
+    if fieldset.complete:
+        return cached_inventories(rows)
+    return build_inventories(rows, fieldset)
@@ -1,3 +1,6 @@
+import json
+
+from pydantic import ValidationError as PydanticValidationError
 from rest_framework import serializers
 
 from interview.inventory.models import (
@@ -6,6 +9,7 @@ from interview.inventory.models import (
     InventoryTag,
     InventoryType,
 )
+from interview.inventory.schemas import InventoryMetaData
 
 
 class InventoryTagSerializer(serializers.ModelSerializer):
@@ -35,3 +39,24 @@ class InventorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Inventory
         fields = ["id", "name", "type", "language", "tags", "metadata"]
+
+
+class InventoryBatchItemSerializer(serializers.Serializer):
+    """One item of a batch create; type, language and tags are given by name."""
+
+    name = serializers.CharField(max_length=255)
+    type = serializers.CharField(max_length=255)
+    language = serializers.CharField(max_length=255)
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=255), default=list
+    )
+    metadata = serializers.JSONField()
+
+    def validate_metadata(self, value):
+        if not isinstance(value, dict):
+            raise serializers.ValidationError("Expected an object.")
+        try:
+            metadata = InventoryMetaData(**value)
+        except PydanticValidationError as e:
+            raise serializers.ValidationError(str(e))
+        return json.loads(metadata.json())
@@ -0,0 +1,124 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from interview.core.signals import active_changed
+from interview.inventory import cache
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.inventory.representations import refresh_documents
+
+# The column of the inventories referencing a type or language row.
+VOCABULARY_COLUMNS = {InventoryType: "type_id", InventoryLanguage: "language_id"}
+
+
+@receiver(post_save, sender=Inventory)
+def refresh_inventory(sender, instance, **kwargs):
+    cache.invalidate([instance])
+    refresh_documents(Inventory.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Inventory)
+def invalidate_inventory(sender, instance, **kwargs):
+    # The document goes with the inventory through the cascade.
+    cache.invalidate([instance])
+
+
+@receiver(m2m_changed, sender=Inventory.tags.through)
+def touch_inventory_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Tag changes do not go through ``Inventory.save``, so move ``updated_at``
+    forward explicitly; readers keyed on it then see the new state.
+    """
+    if action == "pre_clear" and reverse:
+        # Clearing from the tag side does not report the affected inventories.
+        instance._cleared_inventory_ids = list(
+            instance.inventories.values_list("pk", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        pks = [instance.pk]
+    elif action == "post_clear":
+        pks = instance.__dict__.pop("_cleared_inventory_ids", [])
+    else:
+        pks = list(pk_set)
+
+    now = timezone.now()
+    inventories = Inventory.objects.filter(pk__in=pks)
+    inventories.update(updated_at=now)
+    refresh_documents(inventories)
+    if not reverse:
+        instance.updated_at = now
+
+
+def refresh_documents_on_commit(inventories):
+    """
+    Re-render the documents of the ``inventories`` queryset, in chunks, once
+    the transaction commits, then retire the cached representations rendered
+    from the old documents meanwhile.
+    """
+
+    def refresh():
+        refresh_documents(inventories)
+        cache.bump_generation()
+
+    transaction.on_commit(refresh)
+
+
+@receiver(pre_delete, sender=InventoryTag)
+def collect_tagged_inventories(sender, instance, **kwargs):
+    # The links are gone by post_delete, note which documents embed the tag.
+    instance._tagged_inventory_ids = list(
+        instance.inventories.values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=InventoryTag)
+@receiver(post_delete, sender=InventoryTag)
+@receiver(post_save, sender=InventoryType)
+@receiver(post_delete, sender=InventoryType)
+@receiver(post_save, sender=InventoryLanguage)
+@receiver(post_delete, sender=InventoryLanguage)
+def invalidate_vocabulary(sender, instance, created=False, **kwargs):
+    """
+    Move the vocabulary snapshot and the cached representations forward, and
+    re-render the documents embedding ``instance`` after commit. New rows are
+    not embedded anywhere yet, and deleting a type or language deletes its
+    inventories.
+    """
+    cache.bump_generation()
+    if created:
+        return
+    if hasattr(instance, "_tagged_inventory_ids"):
+        inventories = Inventory.objects.filter(pk__in=instance._tagged_inventory_ids)
+    elif sender is InventoryTag:
+        inventories = Inventory.objects.filter(pk__in=tagged_inventories([instance.pk]))
+    else:
+        inventories = Inventory.objects.filter(
+            **{VOCABULARY_COLUMNS[sender]: instance.pk}
+        )
+    refresh_documents_on_commit(inventories)
+
+
+@receiver(active_changed, sender=InventoryTag)
+def invalidate_vocabulary_rows(sender, pks, **kwargs):
+    """``invalidate_vocabulary`` for a bulk ``is_active`` change of ``pks``."""
+    cache.bump_generation()
+    refresh_documents_on_commit(
+        Inventory.objects.filter(pk__in=tagged_inventories(pks))
+    )
+
+
+def tagged_inventories(tag_ids):
+    """Ids of the inventories tagged with ``tag_ids``, from the through table."""
+    return Inventory.tags.through.objects.filter(inventorytag_id__in=tag_ids).values(
+        "inventory_id"
+    )
@@ -1,10 +1,71 @@
+import gzip
+import json
+import os
+import random
+import tempfile
+from unittest import skipUnless
 from datetime import date, timedelta
+from io import StringIO
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F, Prefetch
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
 
+from interview.core.fragments import FragmentJSONRenderer, FragmentList
+from interview.core.models import ImportCheckpoint, VersionStamp
+from interview.core.streaming import ndjson_line
+from interview.core.versions import UNSET_VERSION, pinned_versions
+from interview.core.views import VocabularyBundleView
+from interview.core.vocabulary import get_vocabulary
 from interview.tests.api_request_factory import APIViewRequestFactory
-from interview.inventory.views import InventoryListCreateView
-from interview.inventory.serializers import InventorySerializer
-from interview.inventory.models import Inventory
+from interview.inventory import cache
+from interview.inventory.management.commands.import_inventories import (
+    Command as ImportInventoriesCommand,
+)
+from interview.inventory.representations import (
+    inventory_values,
+    render_inventories,
+    tags_by_inventory,
+)
+from interview.inventory.views import (
+    InventoryAutocompleteView,
+    InventoryBatchView,
+    InventoryCacheStatsView,
+    InventoryExportView,
+    InventoryListCreateView,
+    InventoryMultiGetView,
+    InventoryRetrieveUpdateDestroyView,
+    InventorySearchView,
+    InventoryTagAutocompleteView,
+    filter_metadata,
+)
+from interview.inventory.serializers import (
+    InventorySerializer,
+    InventoryTagSerializer,
+)
+from interview.inventory.models import (
+    Inventory,
+    InventoryDocument,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+
+
+def serialized_inventories(queryset):
+    """``InventorySerializer`` output with tags in id order, as rendered."""
+    tags = Prefetch("tags", queryset=InventoryTag.objects.order_by("id"))
+    return InventorySerializer(queryset.prefetch_related(tags), many=True).data
+
+
+def load_vocabularies():
+    for model in (InventoryType, InventoryLanguage, InventoryTag):
+        get_vocabulary(model).load()
 
 
 class TestInventoryListCreateView(APIViewRequestFactory):
@@ -39,3 +100,1121 @@ class TestInventoryListCreateView(APIViewRequestFactory):
         response = self.send_request_to_view(method="get", query_params=query_params)
         self.assertEqual(response.data["results"], [])
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_of_inventories_query_count_is_constant(self):
+        template = Inventory.objects.first()
+        tag = InventoryTag.objects.create(name="Drama", is_active=True)
+        for i in range(10):
+            inventory = Inventory.objects.create(
+                name=f"Sequel {i}",
+                type=template.type,
+                language=template.language,
+                metadata=template.metadata,
+            )
+            inventory.tags.add(tag)
+        load_vocabularies()
+
+        # version stamps, validators, count, page and tags prefetch, independent
+        # of the page size
+        with self.assertNumQueries(5):
+            small_page = self.send_request_to_view(
+                method="get", query_params={"limit": 2}
+            )
+        with self.assertNumQueries(5):
+            large_page = self.send_request_to_view(
+                method="get", query_params={"limit": 11}
+            )
+
+        self.assertEqual(len(small_page.data["results"]), 2)
+        self.assertEqual(len(large_page.data["results"]), 11)
+
+    def test_cursor_pagination_walks_catalogue_in_key_order(self):
+        template = Inventory.objects.first()
+        for i in range(4):
+            Inventory.objects.create(
+                name=f"Sequel {i}",
+                type=template.type,
+                language=template.language,
+                metadata=template.metadata,
+            )
+        expected_ids = list(
+            Inventory.objects.order_by("created_at", "id").values_list("id", flat=True)
+        )
+
+        query_params = {"pagination": "cursor", "limit": 2}
+        seen_ids = []
+        while True:
+            response = self.send_request_to_view(
+                method="get", query_params=query_params
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            seen_ids += [item["id"] for item in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            next_query = parse_qs(urlparse(response.data["next"]).query)
+            self.assertNotIn("pagination", next_query)
+            query_params = {"cursor": next_query["cursor"][0], "limit": 2}
+
+            # Rows inserted while paging land after the cursor, never before it.
+            if len(seen_ids) == 2:
+                late = Inventory.objects.create(
+                    name="Late arrival",
+                    type=template.type,
+                    language=template.language,
+                    metadata=template.metadata,
+                )
+                expected_ids.append(late.id)
+
+        self.assertEqual(seen_ids, expected_ids)
+
+    def test_cursor_pagination_with_date_filter(self):
+        created_after_date = (date.today() + timedelta(days=1)).isoformat()
+        query_params = {"pagination": "cursor", "created_after": created_after_date}
+
+        response = self.send_request_to_view(method="get", query_params=query_params)
+
+        self.assertEqual(response.data["results"], [])
+        self.assertIsNone(response.data["next"])
+
+    def test_cursor_pagination_with_invalid_cursor(self):
+        response = self.send_request_to_view(
+            method="get", query_params={"cursor": "not-a-cursor"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_conditional_get(self):
+        response = self.send_request_to_view(method="get")
+        etag = response["ETag"]
+        # Deletes do not move it, so lists have none.
+        self.assertNotIn("Last-Modified", response)
+
+        # version stamps and validators
+        with self.assertNumQueries(2):
+            response = self.send_request_to_view(
+                method="get", headers={"HTTP_IF_NONE_MATCH": etag}
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.send_request_to_view(
+            method="get",
+            query_params={"limit": 1},
+            headers={"HTTP_IF_NONE_MATCH": etag},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        inventory = Inventory.objects.first()
+        inventory.name = "The Matrix Reloaded"
+        inventory.save()
+        response = self.send_request_to_view(
+            method="get", headers={"HTTP_IF_NONE_MATCH": etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+        Inventory.objects.create(
+            name="The Animatrix",
+            type=inventory.type,
+            language=inventory.language,
+            metadata=inventory.metadata,
+        )
+        etag = self.send_request_to_view(method="get")["ETag"]
+        # Not the latest row: only the count moves.
+        inventory.delete()
+        response = self.send_request_to_view(
+            method="get", headers={"HTTP_IF_NONE_MATCH": etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_conditional_get_without_exact_count(self):
+        for query_params in ({"pagination": "cursor"}, {"count": "none"}):
+            response = self.send_request_to_view(
+                method="get", query_params=query_params
+            )
+            headers = {"HTTP_IF_NONE_MATCH": response["ETag"]}
+
+            # version stamps and page, no aggregate over the whole list
+            with self.assertNumQueries(2):
+                response = self.send_request_to_view(
+                    method="get", query_params=query_params, headers=headers
+                )
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        inventory = Inventory.objects.first()
+        inventory.name = "The Matrix Reloaded"
+        inventory.save()
+        response = self.send_request_to_view(
+            method="get", query_params=query_params, headers=headers
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_filtered_by_metadata(self):
+        template = Inventory.objects.first()
+        for year, imdb_rating, rotten_tomatoes_rating in [
+            (2003, 7.2, 74),
+            (2003, 6.7, 34),
+            (2021, 5.7, 63),
+        ]:
+            Inventory.objects.create(
+                name=f"Sequel {year} {imdb_rating}",
+                type=template.type,
+                language=template.language,
+                metadata={
+                    **template.metadata,
+                    "year": year,
+                    "imdb_rating": imdb_rating,
+                    "rotten_tomatoes_rating": rotten_tomatoes_rating,
+                },
+            )
+
+        def names(**query_params):
+            response = self.send_request_to_view(
+                method="get", query_params={"limit": 10, **query_params}
+            )
+            return [item["name"] for item in response.data["results"]]
+
+        self.assertEqual(names(year=2003), ["Sequel 2003 7.2", "Sequel 2003 6.7"])
+        self.assertEqual(
+            names(year_min=2000, year_max=2010),
+            ["Sequel 2003 7.2", "Sequel 2003 6.7"],
+        )
+        self.assertEqual(names(imdb_rating_min=7), ["The Matrix", "Sequel 2003 7.2"])
+        self.assertEqual(
+            names(rotten_tomatoes_min=60, year_min=2000),
+            ["Sequel 2003 7.2", "Sequel 2021 5.7"],
+        )
+        self.assertEqual(names(year="nineteen"), [])
+        self.assertEqual(names(imdb_rating_min="nan"), [])
+
+    def test_list_filtered_by_tags(self):
+        template = Inventory.objects.first()
+        action = InventoryTag.objects.get(name="Action")
+        drama = InventoryTag.objects.create(name="Drama", is_active=True)
+        for name, tags in [("Both", [action, drama]), ("Drama only", [drama])]:
+            inventory = Inventory.objects.create(
+                name=name,
+                type=template.type,
+                language=template.language,
+                metadata=template.metadata,
+            )
+            inventory.tags.set(tags)
+
+        def names(**query_params):
+            response = self.send_request_to_view(
+                method="get", query_params={"limit": 10, **query_params}
+            )
+            return [item["name"] for item in response.data["results"]]
+
+        tags = f"{action.id},{drama.id}"
+        self.assertEqual(names(tags=tags), ["The Matrix", "Both", "Drama only"])
+        self.assertEqual(names(tags=tags, tags_match="all"), ["Both"])
+        self.assertEqual(names(tags=drama.id, tags_match="all"), ["Both", "Drama only"])
+        self.assertEqual(names(tags=tags, pagination="cursor", limit=1), ["The Matrix"])
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        self.assertEqual(names(tags=tags, created_after=tomorrow), [])
+        self.assertEqual(names(tags="drama"), [])
+        self.assertEqual(names(tags=tags, tags_match="some"), [])
+
+    def test_list_with_sparse_fieldset(self):
+        inventory = Inventory.objects.first()
+        load_vocabularies()
+
+        # version stamps, validators, count and page: no tags query
+        with self.assertNumQueries(4):
+            response = self.send_request_to_view(
+                method="get",
+                query_params={"fields": "name,id,type", "expand": ""},
+            )
+
+        self.assertEqual(
+            response.data["results"][0],
+            {"id": inventory.id, "name": inventory.name, "type": inventory.type_id},
+        )
+
+        response = self.send_request_to_view(
+            method="get", query_params={"fields": "id,tags", "expand": "tags"}
+        )
+        self.assertEqual(
+            response.data["results"][0],
+            {
+                "id": inventory.id,
+                "tags": InventoryTagSerializer(inventory.tags.all(), many=True).data,
+            },
+        )
+
+    def test_list_with_unknown_fields(self):
+        response = self.send_request_to_view(
+            method="get", query_params={"fields": "id,secret", "expand": "owner"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("fields", response.data)
+        self.assertIn("expand", response.data)
+
+    @skipUnless(connection.vendor == "postgresql", "JSON containment needs Postgres")
+    def test_list_filtered_by_actor(self):
+        response = self.send_request_to_view(
+            method="get", query_params={"actor": "Keanu Reeves"}
+        )
+        self.assertEqual(response.data["count"], 1)
+
+        response = self.send_request_to_view(
+            method="get", query_params={"actor": "Keanu"}
+        )
+        self.assertEqual(response.data["count"], 0)
+
+    def test_list_is_stitched_from_cached_fragments(self):
+        serialized = InventorySerializer(Inventory.objects.all()[:3], many=True).data
+        self.send_request_to_view(method="get")
+
+        response = self.send_request_to_view(method="get")
+        content = response.render().content
+
+        self.assertIsInstance(response.data["results"], FragmentList)
+        self.assertFalse(response.data["results"].decoded)
+        self.assertEqual(
+            json.loads(content)["results"],
+            json.loads(JSONRenderer().render(serialized)),
+        )
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_list_reports_exact_count_strategy_by_default(self):
+        response = self.send_request_to_view(method="get")
+
+        self.assertEqual(response.data["count"], Inventory.objects.count())
+        self.assertEqual(response.data["count_strategy"], "exact")
+        self.assertNotIn("has_next", response.data)
+
+    def test_list_without_count(self):
+        response = self.send_request_to_view(
+            method="get", query_params={"count": "none", "limit": 1}
+        )
+
+        self.assertIsNone(response.data["count"])
+        self.assertEqual(response.data["count_strategy"], "none")
+        self.assertFalse(response.data["has_next"])
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_list_with_cached_count(self):
+        query_params = {"count": "cached"}
+        load_vocabularies()
+
+        # version stamps, the count that fills the cache, page and documents;
+        # the validators come from the page
+        with self.assertNumQueries(4):
+            self.send_request_to_view(method="get", query_params=query_params)
+        # version stamps and page: the count and the representations are cached
+        with self.assertNumQueries(2):
+            response = self.send_request_to_view(
+                method="get", query_params=query_params
+            )
+
+        self.assertEqual(response.data["count"], Inventory.objects.count())
+        self.assertEqual(response.data["count_strategy"], "cached")
+
+    def test_list_with_estimated_count(self):
+        response = self.send_request_to_view(
+            method="get", query_params={"count": "estimate"}
+        )
+
+        # Small tables fall back to an exact count.
+        self.assertEqual(response.data["count"], Inventory.objects.count())
+        self.assertEqual(response.data["count_strategy"], "estimate")
+
+
+class TestInventoryRetrieveUpdateDestroyView(APIViewRequestFactory):
+    view_name = InventoryRetrieveUpdateDestroyView
+
+    def test_retrieve_inventory(self):
+        inventory = Inventory.objects.first()
+        load_vocabularies()
+
+        # version stamps, row and document
+        with self.assertNumQueries(3):
+            response = self.send_request_to_view(
+                method="get", path_params={"id": inventory.id}
+            )
+
+        self.assertEqual(response.data, InventorySerializer(inventory).data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_inventory_with_sparse_fieldset(self):
+        inventory = Inventory.objects.first()
+
+        response = self.send_request_to_view(
+            method="get",
+            path_params={"id": inventory.id},
+            query_params={"fields": "id,language,tags", "expand": "language"},
+        )
+
+        self.assertEqual(
+            response.data,
+            {
+                "id": inventory.id,
+                "language": {
+                    "id": inventory.language_id,
+                    "name": inventory.language.name,
+                },
+                "tags": list(inventory.tags.values_list("id", flat=True)),
+            },
+        )
+
+    def test_retrieve_inventory_conditional_get(self):
+        inventory = Inventory.objects.first()
+        path_params = {"id": inventory.id}
+        response = self.send_request_to_view(method="get", path_params=path_params)
+
+        # version stamps and row
+        with self.assertNumQueries(2):
+            not_modified = self.send_request_to_view(
+                method="get",
+                path_params=path_params,
+                headers={"HTTP_IF_NONE_MATCH": response["ETag"]},
+            )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        not_modified = self.send_request_to_view(
+            method="get",
+            path_params=path_params,
+            headers={"HTTP_IF_MODIFIED_SINCE": response["Last-Modified"]},
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            inventory.tags.first().delete()
+        response = self.send_request_to_view(
+            method="get",
+            path_params=path_params,
+            headers={"HTTP_IF_NONE_MATCH": response["ETag"]},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["tags"], [])
+
+    def test_retrieve_inventory_is_served_from_cache(self):
+        inventory = Inventory.objects.first()
+        path_params = {"id": inventory.id}
+
+        self.send_request_to_view(method="get", path_params=path_params)
+        # version stamps and row
+        with self.assertNumQueries(2):
+            response = self.send_request_to_view(method="get", path_params=path_params)
+
+        self.assertEqual(response.data, InventorySerializer(inventory).data)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_retrieve_inventory_after_tag_changes(self):
+        inventory = Inventory.objects.first()
+        path_params = {"id": inventory.id}
+        self.send_request_to_view(method="get", path_params=path_params)
+
+        tag = inventory.tags.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.name = "Sci-Fi"
+            tag.save()
+        response = self.send_request_to_view(method="get", path_params=path_params)
+        self.assertEqual(response.data["tags"][0]["name"], "Sci-Fi")
+
+        inventory.tags.add(InventoryTag.objects.create(name="Classic"))
+        response = self.send_request_to_view(method="get", path_params=path_params)
+        self.assertEqual(
+            [tag["name"] for tag in response.data["tags"]], ["Sci-Fi", "Classic"]
+        )
+        self.assertEqual(cache.stats()["misses"], 3)
+
+
+class TestInventoryAutocompleteView(APIViewRequestFactory):
+    view_name = InventoryAutocompleteView
+
+    def test_autocomplete_matches_prefix_case_insensitively(self):
+        matrix = Inventory.objects.get(name="The Matrix")
+
+        response = self.send_request_to_view(method="get", query_params={"q": "the m"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{"id": matrix.id, "name": "The Matrix"}])
+
+        response = self.send_request_to_view(method="get", query_params={"q": "matrix"})
+        self.assertEqual(response.data, [])
+
+    def test_autocomplete_is_bounded_and_cached(self):
+        template = Inventory.objects.first()
+        for i in range(30):
+            Inventory.objects.create(
+                name=f"The Matrix {i}",
+                type=template.type,
+                language=template.language,
+                metadata=template.metadata,
+            )
+
+        query_params = {"q": "The", "limit": 1000}
+        response = self.send_request_to_view(method="get", query_params=query_params)
+        self.assertEqual(len(response.data), InventoryAutocompleteView.max_limit)
+
+        with self.assertNumQueries(0):
+            cached = self.send_request_to_view(method="get", query_params=query_params)
+        self.assertEqual(cached.data, response.data)
+
+    def test_autocomplete_requires_a_prefix(self):
+        response = self.send_request_to_view(method="get")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @skipUnless(connection.vendor == "postgresql", "The plan needs Postgres")
+    def test_autocomplete_reads_the_index_in_order(self):
+        queryset = InventoryAutocompleteView().get_queryset("the")[:10]
+        with connection.cursor() as cursor:
+            # The fixture table is too small for the planner to prefer it.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = queryset.explain()
+
+        self.assertIn("inventory_name_upper_c_idx", plan)
+        self.assertNotIn("Sort", plan)
+
+
+class TestInventoryTagAutocompleteView(APIViewRequestFactory):
+    view_name = InventoryTagAutocompleteView
+
+    def test_autocomplete_tags(self):
+        action = InventoryTag.objects.get(name="Action")
+        InventoryTag.objects.create(name="Drama", is_active=True)
+
+        response = self.send_request_to_view(method="get", query_params={"q": "ac"})
+
+        self.assertEqual(response.data, [{"id": action.id, "name": "Action"}])
+
+
+class TestVocabularyCache(APIViewRequestFactory):
+    def test_get_by_name_is_served_from_memory(self):
+        tag = InventoryTag.objects.get(name="Action")
+        load_vocabularies()
+
+        # the version stamps, then the unknown name from the table
+        with pinned_versions(), self.assertNumQueries(2):
+            cached = InventoryTag.get_by_name("Action")
+            missing = InventoryTag.get_by_name("Unknown")
+
+        self.assertEqual(cached, tag)
+        self.assertEqual(cached.is_active, tag.is_active)
+        self.assertIsNone(missing)
+
+    def test_vocabulary_changes_are_picked_up(self):
+        tag = InventoryTag.objects.get(name="Action")
+        load_vocabularies()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.name = "Adventure"
+            tag.save()
+
+        self.assertIsNone(InventoryTag.get_by_name("Action"))
+        self.assertEqual(InventoryTag.get_by_name("Adventure"), tag)
+        [data] = render_inventories(
+            inventory_values(Inventory.objects.filter(name="The Matrix"))
+        )
+        self.assertEqual(data["tags"][0]["name"], "Adventure")
+
+    def test_reading_stamps_does_not_create_them(self):
+        VersionStamp.objects.all().delete()
+
+        self.assertEqual(cache.get_generation(), UNSET_VERSION)
+        with pinned_versions():
+            self.assertEqual(cache.get_generation(), UNSET_VERSION)
+        self.assertFalse(VersionStamp.objects.exists())
+
+        cache.bump_generation()
+        self.assertGreater(cache.get_generation(), UNSET_VERSION)
+
+    def test_stamps_are_shared_through_the_database(self):
+        load_vocabularies()
+        InventoryTag.objects.filter(name="Action").update(name="Adventure")
+        # What a bump by another worker amounts to for this one.
+        VersionStamp.objects.filter(name=cache.VOCABULARY_VERSION).update(
+            version=F("version") + 1
+        )
+
+        self.assertEqual(InventoryTag.get_by_name("Adventure").name, "Adventure")
+        self.assertIsNone(InventoryTag.get_by_name("Action"))
+
+    def test_rows_newer_than_the_snapshot_are_found(self):
+        inventory = Inventory.objects.get(name="The Matrix")
+        load_vocabularies()
+        # Written without a bump, as by a worker whose stamp is not visible yet.
+        [tag] = InventoryTag.objects.bulk_create([InventoryTag(name="Sci-Fi")])
+        Inventory.tags.through.objects.create(inventory=inventory, inventorytag=tag)
+
+        tags = tags_by_inventory([inventory.id])[inventory.id]
+
+        self.assertEqual([item["name"] for item in tags], ["Action", "Sci-Fi"])
+
+
+class TestInventoryMultiGetView(APIViewRequestFactory):
+    view_name = InventoryMultiGetView
+
+    def test_multi_get_preserves_order_and_reports_missing(self):
+        template = Inventory.objects.first()
+        sequel = Inventory.objects.create(
+            name="The Matrix Reloaded",
+            type=template.type,
+            language=template.language,
+            metadata=template.metadata,
+        )
+        ids = [sequel.id, 0, template.id, sequel.id]
+        load_vocabularies()
+
+        # version stamps, rows and documents, whatever the number of ids
+        with self.assertNumQueries(3):
+            response = self.send_request_to_view(
+                method="get", query_params={"ids": ",".join(map(str, ids))}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            InventorySerializer([sequel, template], many=True).data,
+        )
+        self.assertEqual(response.data["missing"], [0])
+
+    def test_multi_get_with_invalid_ids(self):
+        too_many = ",".join(map(str, range(settings.MULTI_GET_MAX_IDS + 1)))
+        for ids in ("", "1,two", too_many):
+            response = self.send_request_to_view(
+                method="get", query_params={"ids": ids}
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestVocabularyBundleView(APIViewRequestFactory):
+    view_name = VocabularyBundleView
+
+    def test_bundle(self):
+        response = self.send_request_to_view(method="get")
+        bundle = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], f'"{bundle["hash"]}"')
+        self.assertIn("max-age=", response["Cache-Control"])
+        self.assertEqual(
+            bundle["vocabularies"]["inventory_tags"],
+            InventoryTagSerializer(InventoryTag.objects.all(), many=True).data,
+        )
+        self.assertEqual(
+            set(bundle["vocabularies"]),
+            {"inventory_languages", "inventory_tags", "inventory_types", "order_tags"},
+        )
+
+    def test_bundle_is_regenerated_on_vocabulary_changes(self):
+        response = self.send_request_to_view(method="get")
+        headers = {"HTTP_IF_NONE_MATCH": response["ETag"]}
+
+        # version stamps only
+        with self.assertNumQueries(1):
+            cached = self.send_request_to_view(method="get", headers=headers)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        InventoryLanguage.objects.create(name="French")
+        response = self.send_request_to_view(method="get", headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        languages = json.loads(response.content)["vocabularies"]["inventory_languages"]
+        self.assertIn("French", [language["name"] for language in languages])
+
+
+class TestInventoryCacheStatsView(APIViewRequestFactory):
+    view_name = InventoryCacheStatsView
+
+    def test_cache_stats(self):
+        cache.increment(cache.HITS_KEY, 3)
+        cache.increment(cache.MISSES_KEY, 1)
+
+        response = self.send_request_to_view(method="get")
+
+        self.assertEqual(response.data, {"hits": 3, "misses": 1, "hit_rate": 0.75})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestInventoryBatchView(APIViewRequestFactory):
+    view_name = InventoryBatchView
+
+    def build_item(self, name, **overrides):
+        item = {
+            "name": name,
+            "type": "Movie",
+            "language": "English",
+            "tags": ["Action"],
+            "metadata": {
+                "year": 2003,
+                "actors": ["Keanu Reeves"],
+                "imdb_rating": 7.2,
+                "rotten_tomatoes_rating": 74,
+            },
+        }
+        item.update(overrides)
+        return item
+
+    def send_batch(self, items, query_params=None):
+        factory = APIRequestFactory()
+        query_string = urlencode(query_params or {})
+        request = factory.post(f"/fake_url/?{query_string}", items, format="json")
+        with pinned_versions():
+            return self.view_name.as_view()(request)
+
+    def test_batch_create(self):
+        items = [self.build_item(f"The Matrix {i}") for i in range(20)]
+        load_vocabularies()
+
+        # version stamps, savepoint, inventories, tag links and documents
+        # (rows, tag links and upsert)
+        with self.assertNumQueries(8):
+            response = self.send_batch(items)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(
+            [item["index"] for item in response.data["created"]], list(range(20))
+        )
+        created = Inventory.objects.get(id=response.data["created"][0]["id"])
+        self.assertEqual(created.name, "The Matrix 0")
+        self.assertEqual(created.metadata["imdb_rating"], 7.2)
+        self.assertEqual([tag.name for tag in created.tags.all()], ["Action"])
+
+    def test_batch_create_reports_errors_by_index(self):
+        items = [
+            self.build_item("The Matrix Reloaded"),
+            self.build_item("Unknown", type="Podcast", tags=["Action", "Noir"]),
+            self.build_item("Bad metadata", metadata={"year": "soon"}),
+        ]
+
+        response = self.send_batch(items)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([item["index"] for item in response.data["created"]], [0])
+        errors = {item["index"]: item["errors"] for item in response.data["errors"]}
+        self.assertEqual(list(errors), [1, 2])
+        self.assertEqual(errors[1]["type"], ["Unknown inventory type 'Podcast'."])
+        self.assertEqual(errors[1]["tags"], ["Unknown inventory tag 'Noir'."])
+        self.assertIn("metadata", errors[2])
+        self.assertTrue(Inventory.objects.filter(name="The Matrix Reloaded").exists())
+
+    def test_atomic_batch_create_rejects_whole_batch(self):
+        items = [self.build_item("The Matrix Reloaded"), self.build_item("")]
+
+        response = self.send_batch(items, query_params={"atomic": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["created"], [])
+        self.assertEqual(response.data["errors"][0]["index"], 1)
+        self.assertFalse(Inventory.objects.filter(name="The Matrix Reloaded").exists())
+
+    def test_batch_create_requires_a_list(self):
+        response = self.send_batch(self.build_item("The Matrix Reloaded"))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestInventoryExportView(APIViewRequestFactory):
+    view_name = InventoryExportView
+
+    def read_lines(self, response):
+        content = b"".join(response.streaming_content)
+        if response["Content-Type"] == "application/gzip":
+            content = gzip.decompress(content)
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export_streams_ndjson(self):
+        template = Inventory.objects.first()
+        for i in range(5):
+            Inventory.objects.create(
+                name=f"Sequel {i}",
+                type=template.type,
+                language=template.language,
+                metadata=template.metadata,
+            ).tags.add(*template.tags.all())
+
+        response = self.send_request_to_view(method="get")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        expected = serialized_inventories(Inventory.objects.order_by("id"))
+        self.assertEqual(self.read_lines(response), json.loads(json.dumps(expected)))
+
+    def test_export_with_gzip_and_date_filter(self):
+        created_after_date = (date.today() + timedelta(days=1)).isoformat()
+
+        response = self.send_request_to_view(
+            method="get",
+            query_params={"compress": "gzip", "created_after": created_after_date},
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn('filename="inventory.ndjson.gz"', response["Content-Disposition"])
+        self.assertEqual(self.read_lines(response), [])
+
+        response = self.send_request_to_view(
+            method="get", query_params={"compress": "gzip"}
+        )
+        self.assertEqual(len(self.read_lines(response)), Inventory.objects.count())
+
+
+class InterruptedImport(ImportInventoriesCommand):
+    """Fails right after writing its second batch."""
+
+    batches = 0
+
+    def write_batch(self, items, serializer):
+        result = super().write_batch(items, serializer)
+        self.batches += 1
+        if self.batches == 2:
+            raise RuntimeError("Interrupted")
+        return result
+
+
+class TestImportInventoriesCommand(APIViewRequestFactory):
+    def write_file(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, "w") as source:
+            source.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def import_file(self, path, *args):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("import_inventories", path, *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_import_csv(self):
+        metadata = json.dumps(Inventory.objects.first().metadata).replace('"', '""')
+        path = self.write_file(
+            ".csv",
+            "name,type,language,tags,metadata\n"
+            f'"Matrix, The Reloaded",Movie,English,Action,"{metadata}"\n'
+            f'Unknown,Podcast,English,,"{metadata}"\n'
+            f'The Matrix Revolutions,Movie,English,Action|Action,"{metadata}"\n',
+        )
+
+        stdout, stderr = self.import_file(path, "--batch-size", "2")
+
+        self.assertIn("Imported 2 of 3 records", stdout)
+        self.assertIn("rows/sec", stdout)
+        self.assertIn("Record 2:", stderr)
+        imported = Inventory.objects.get(name="Matrix, The Reloaded")
+        self.assertEqual([tag.name for tag in imported.tags.all()], ["Action"])
+        self.assertTrue(
+            Inventory.objects.filter(name="The Matrix Revolutions").exists()
+        )
+
+    def test_import_ndjson_resumes_from_checkpoint(self):
+        template = Inventory.objects.first()
+        lines = [
+            json.dumps(
+                {
+                    "name": f"Animatrix {i}",
+                    "type": "Movie",
+                    "language": "English",
+                    "tags": ["Action"],
+                    "metadata": template.metadata,
+                }
+            )
+            for i in range(5)
+        ]
+        path = self.write_file(".ndjson", "\n".join(lines[:3]) + "\n")
+
+        self.import_file(path, "--batch-size", "2")
+        with open(path, "a") as source:
+            source.write("\n".join(lines[3:]) + "\n")
+        stdout, _ = self.import_file(path, "--batch-size", "2")
+
+        self.assertIn("Resuming after record 3.", stdout)
+        self.assertIn("Imported 5 of 5 records", stdout)
+        self.assertEqual(
+            Inventory.objects.filter(name__startswith="Animatrix").count(), 5
+        )
+        checkpoint = ImportCheckpoint.objects.get(
+            name=f"import_inventories:{os.path.abspath(path)}"
+        )
+        self.assertEqual((checkpoint.records, checkpoint.created), (5, 5))
+
+    def test_interrupted_import_writes_each_record_once(self):
+        template = Inventory.objects.first()
+        lines = [
+            json.dumps(
+                {
+                    "name": f"Animatrix {i}",
+                    "type": "Movie",
+                    "language": "English",
+                    "metadata": template.metadata,
+                }
+            )
+            for i in range(4)
+        ]
+        path = self.write_file(".ndjson", "\n".join(lines) + "\n")
+        args = [path, "--batch-size", "2", "--checkpoint", "animatrix"]
+
+        with self.assertRaises(RuntimeError):
+            call_command(InterruptedImport(), *args, stdout=StringIO())
+        # The second batch was rolled back together with its checkpoint.
+        self.assertEqual(
+            Inventory.objects.filter(name__startswith="Animatrix").count(), 2
+        )
+
+        stdout, _ = self.import_file(*args)
+
+        self.assertIn("Resuming after record 2.", stdout)
+        self.assertEqual(
+            Inventory.objects.filter(name__startswith="Animatrix").count(), 4
+        )
+
+
+class TestInventoryDocuments(APIViewRequestFactory):
+    def document(self, inventory):
+        return InventoryDocument.objects.get(inventory=inventory).document
+
+    def rendered(self, inventory):
+        queryset = Inventory.objects.filter(pk=inventory.pk)
+        return render_inventories(inventory_values(queryset))[0]
+
+    def refresh_stale(self) -> str:
+        stdout = StringIO()
+        call_command("refresh_inventory_documents", "--stale", stdout=stdout)
+        return stdout.getvalue()
+
+    def test_documents_follow_writes(self):
+        inventory = Inventory.objects.get(name="The Matrix")
+        tag = InventoryTag.objects.get(name="Action")
+
+        self.assertEqual(self.document(inventory), InventorySerializer(inventory).data)
+
+        inventory.name = "The Matrix Reloaded"
+        inventory.save()
+        self.assertEqual(self.document(inventory)["name"], "The Matrix Reloaded")
+
+        # Vocabulary changes re-render the documents embedding the row once
+        # the transaction commits.
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.name = "Sci-Fi"
+            tag.save()
+            self.assertEqual(self.document(inventory)["tags"][0]["name"], "Action")
+        self.assertEqual(self.document(inventory)["tags"][0]["name"], "Sci-Fi")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.delete()
+        self.assertEqual(self.document(inventory)["tags"], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            inventory.language.name = "British English"
+            inventory.language.save()
+        self.assertEqual(
+            self.document(inventory)["language"]["name"], "British English"
+        )
+        self.assertIn("Refreshed 0 inventory documents.", self.refresh_stale())
+
+    def test_only_referencing_documents_are_rendered(self):
+        matrix = Inventory.objects.get(name="The Matrix")
+        other = Inventory.objects.create(
+            name="Untagged",
+            type=matrix.type,
+            language=InventoryLanguage.objects.create(name="French"),
+            metadata=matrix.metadata,
+        )
+        # A document that would be overwritten if it were rendered again.
+        InventoryDocument.objects.filter(inventory=other).update(document={})
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            InventoryTag.objects.create(name="Drama")
+        self.assertEqual(callbacks, [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag = InventoryTag.objects.get(name="Action")
+            tag.name = "Sci-Fi"
+            tag.save()
+            matrix.language.name = "British English"
+            matrix.language.save()
+        self.assertEqual(self.document(other), {})
+        self.assertEqual(self.document(matrix)["tags"][0]["name"], "Sci-Fi")
+
+    def test_documents_follow_bulk_tag_deactivation(self):
+        inventory = Inventory.objects.get(name="The Matrix")
+        tag = InventoryTag.objects.get(name="Action")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(InventoryTag.deactivate([tag.pk]), 1)
+
+        self.assertFalse(get_vocabulary(InventoryTag).get(tag.pk)["is_active"])
+        self.assertFalse(self.document(inventory)["tags"][0]["is_active"])
+
+    def test_stale_documents_are_rendered_on_read(self):
+        inventory = Inventory.objects.get(name="The Matrix")
+        InventoryDocument.objects.all().delete()
+
+        self.assertEqual(self.rendered(inventory)["name"], "The Matrix")
+        # Reads do not write documents.
+        self.assertFalse(InventoryDocument.objects.exists())
+
+        self.refresh_stale()
+        Inventory.objects.filter(pk=inventory.pk).update(
+            name="Bypassed", updated_at=inventory.updated_at + timedelta(seconds=1)
+        )
+        self.assertEqual(self.rendered(inventory)["name"], "Bypassed")
+        self.assertIn("Refreshed 1 inventory documents.", self.refresh_stale())
+        self.assertEqual(self.document(inventory)["name"], "Bypassed")
+
+    def test_refresh_command(self):
+        InventoryDocument.objects.all().delete()
+        stdout = StringIO()
+
+        call_command("refresh_inventory_documents", stdout=stdout)
+
+        self.assertIn("Refreshed 1 inventory documents.", stdout.getvalue())
+        self.assertEqual(InventoryDocument.objects.count(), 1)
+
+
+class TestInventoryRepresentations(APIViewRequestFactory):
+    def test_fragments_are_arrays_for_every_encoder(self):
+        items = [{"id": 1, "name": "The Matrix"}, {"id": 2, "name": "Sequel"}]
+        fragments = FragmentList(json.dumps(item).encode() for item in items)
+
+        spliced = FragmentJSONRenderer().render({"results": fragments})
+        self.assertFalse(fragments.decoded)
+        self.assertEqual(json.loads(spliced), {"results": items})
+        self.assertEqual(json.loads(JSONRenderer().render(fragments)), items)
+        self.assertEqual(json.loads(ndjson_line(fragments)), items)
+
+    def test_render_inventories_matches_serializer_byte_for_byte(self):
+        template = Inventory.objects.first()
+        drama = InventoryTag.objects.create(name="Drama", is_active=False)
+        sequel = Inventory.objects.create(
+            name="The Matrix Reloaded",
+            type=template.type,
+            language=template.language,
+            metadata={**template.metadata, "actors": ["Monica Bellucci"]},
+        )
+        sequel.tags.add(drama, *template.tags.all())
+        Inventory.objects.create(
+            name="Untagged",
+            type=template.type,
+            language=template.language,
+            metadata=template.metadata,
+        )
+        queryset = Inventory.objects.order_by("id")
+
+        serialized = serialized_inventories(queryset)
+        rendered = render_inventories(inventory_values(queryset))
+
+        self.assertEqual(
+            JSONRenderer().render(rendered), JSONRenderer().render(serialized)
+        )
+
+
+@skipUnless(connection.vendor == "postgresql", "Index usage is Postgres specific")
+class TestInventoryMetadataIndexes(APIViewRequestFactory):
+    @classmethod
+    def setUpTestData(cls):
+        template = Inventory.objects.first()
+        rng = random.Random(42)
+        Inventory.objects.bulk_create(
+            Inventory(
+                name=f"Title {i}",
+                type=template.type,
+                language=template.language,
+                metadata={
+                    "year": rng.randint(1920, 2023),
+                    "actors": [f"Actor {rng.randint(0, 5000)}" for _ in range(3)],
+                    "imdb_rating": rng.randint(10, 95) / 10,
+                    "rotten_tomatoes_rating": rng.randint(0, 100),
+                },
+            )
+            for i in range(20000)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE inventory_inventory")
+
+    def explain(self, **query_params):
+        return filter_metadata(Inventory.objects.all(), query_params).explain()
+
+    def test_year_filters_use_expression_index(self):
+        self.assertIn("inventory_metadata_year_idx", self.explain(year=1999))
+        self.assertIn("inventory_metadata_year_idx", self.explain(year_min=2022))
+
+    def test_rating_filters_use_expression_indexes(self):
+        self.assertIn("inventory_metadata_imdb_idx", self.explain(imdb_rating_min=9.4))
+        self.assertIn(
+            "inventory_metadata_rt_idx", self.explain(rotten_tomatoes_min=100)
+        )
+
+    def test_actor_filter_uses_gin_index(self):
+        self.assertIn("inventory_metadata_gin_idx", self.explain(actor="Actor 42"))
+
+
+class TestInventorySearchView(APIViewRequestFactory):
+    view_name = InventorySearchView
+
+    def test_search_requires_a_query(self):
+        response = self.send_request_to_view(method="get", query_params={"q": " "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @skipUnless(connection.vendor == "postgresql", "Search is Postgres specific")
+    def test_search_by_name_and_actor(self):
+        matrix = Inventory.objects.get(name="The Matrix")
+
+        for query in ("matrix", "keanu reeves", "The Matrx"):
+            response = self.send_request_to_view(
+                method="get", query_params={"q": query}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                [result["id"] for result in response.data["results"]], [matrix.id]
+            )
+            self.assertGreater(response.data["results"][0]["rank"], 0)
+
+    @skipUnless(connection.vendor == "postgresql", "Search is Postgres specific")
+    def test_search_pages_by_rank(self):
+        template = Inventory.objects.first()
+        for i in range(5):
+            Inventory.objects.create(
+                name=f"Matrix Sequel {i}",
+                type=template.type,
+                language=template.language,
+                metadata={**template.metadata, "actors": []},
+            )
+
+        query_params = {"q": "matrix", "limit": 2}
+        ranks, seen_ids = [], []
+        while True:
+            response = self.send_request_to_view(
+                method="get", query_params=query_params
+            )
+            ranks += [result["rank"] for result in response.data["results"]]
+            seen_ids += [result["id"] for result in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            cursor = parse_qs(urlparse(response.data["next"]).query)["cursor"][0]
+            query_params = {**query_params, "cursor": cursor}
+
+        self.assertEqual(len(seen_ids), 6)
+        self.assertEqual(len(set(seen_ids)), 6)
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+
+    @skipUnless(connection.vendor == "postgresql", "Search is Postgres specific")
+    def test_search_pages_through_tied_ranks(self):
+        template = Inventory.objects.first()
+        expected_ids = [
+            Inventory.objects.create(
+                name="Matrix Revisited",
+                type=template.type,
+                language=template.language,
+                metadata={**template.metadata, "actors": []},
+            ).id
+            for _ in range(4)
+        ]
+
+        # Pages of one row: every boundary falls between two equal ranks.
+        query_params = {"q": "revisited", "limit": 1}
+        seen_ids = []
+        while True:
+            response = self.send_request_to_view(
+                method="get", query_params=query_params
+            )
+            seen_ids += [result["id"] for result in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            cursor = parse_qs(urlparse(response.data["next"]).query)["cursor"][0]
+            query_params = {**query_params, "cursor": cursor}
+
+        self.assertEqual(seen_ids, expected_ids)
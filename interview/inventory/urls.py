@@ -1,11 +1,20 @@
 from django.urls import path
 from interview.inventory.views import (
+    InventoryAutocompleteView,
+    InventoryBatchView,
+    InventoryCacheStatsView,
+    InventoryExportView,
+    InventoryLanguageAutocompleteView,
     InventoryLanguageListCreateView,
     InventoryLanguageRetrieveUpdateDestroyView,
     InventoryListCreateView,
+    InventoryMultiGetView,
     InventoryRetrieveUpdateDestroyView,
+    InventorySearchView,
+    InventoryTagAutocompleteView,
     InventoryTagListCreateView,
     InventoryTagRetrieveUpdateDestroyView,
+    InventoryTypeAutocompleteView,
     InventoryTypeListCreateView,
     InventoryTypeRetrieveUpdateDestroyView,
 )
@@ -33,11 +42,40 @@ urlpatterns = [
         InventoryTypeRetrieveUpdateDestroyView.as_view(),
         name="inventory-types-detail",
     ),
+    path(
+        "autocomplete/",
+        InventoryAutocompleteView.as_view(),
+        name="inventory-autocomplete",
+    ),
+    path(
+        "languages/autocomplete/",
+        InventoryLanguageAutocompleteView.as_view(),
+        name="inventory-languages-autocomplete",
+    ),
+    path(
+        "tags/autocomplete/",
+        InventoryTagAutocompleteView.as_view(),
+        name="inventory-tags-autocomplete",
+    ),
+    path(
+        "types/autocomplete/",
+        InventoryTypeAutocompleteView.as_view(),
+        name="inventory-types-autocomplete",
+    ),
     path(
         "languages/",
         InventoryLanguageListCreateView.as_view(),
         name="inventory-languages-list",
     ),
+    path("batch/", InventoryBatchView.as_view(), name="inventory-batch"),
+    path("multi/", InventoryMultiGetView.as_view(), name="inventory-multi-get"),
+    path("export/", InventoryExportView.as_view(), name="inventory-export"),
+    path("search/", InventorySearchView.as_view(), name="inventory-search"),
+    path(
+        "cache/stats/",
+        InventoryCacheStatsView.as_view(),
+        name="inventory-cache-stats",
+    ),
     path("tags/", InventoryTagListCreateView.as_view(), name="inventory-tags-list"),
     path("types/", InventoryTypeListCreateView.as_view(), name="inventory-types-list"),
     path("", InventoryListCreateView.as_view(), name="inventory-list"),
@@ -1,11 +1,30 @@
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import Count, Exists, F, FloatField, OuterRef, Q
+from django.db.models.functions import Cast
+from django.http import StreamingHttpResponse
 from django.utils.dateparse import parse_date
 from django.utils.timezone import make_aware
+import math
 from datetime import datetime, time
 
+from interview.core import conditional
+from interview.core.autocomplete import AutocompleteView
+from interview.core.multiget import MultiGetView
+from interview.core.streaming import (
+    GZIP_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    NDJSONRenderer,
+    gzip_stream,
+    ndjson_line,
+    render_chunks,
+)
+from interview.inventory import batch, cache
 from interview.inventory.models import (
     Inventory,
     InventoryLanguage,
@@ -13,8 +32,21 @@ from interview.inventory.models import (
     InventoryType,
 )
 from interview.inventory.schemas import InventoryMetaData
-from interview.inventory.pagination import InventoryPagination
+from interview.inventory.representations import (
+    INVENTORY_VALUES,
+    cached_inventories,
+    inventory_fieldset,
+    inventory_representations,
+    inventory_values,
+    render_inventories,
+)
+from interview.inventory.pagination import (
+    InventoryCursorPagination,
+    InventoryPagination,
+    InventorySearchPagination,
+)
 from interview.inventory.serializers import (
+    InventoryBatchItemSerializer,
     InventoryLanguageSerializer,
     InventorySerializer,
     InventoryTagSerializer,
@@ -22,10 +54,100 @@ from interview.inventory.serializers import (
 )
 
 
+def filter_created_after(queryset, date_filter):
+    if not date_filter:
+        return queryset
+
+    date = parse_date(date_filter)
+    if not date:
+        return queryset.none()
+
+    aware_datetime = make_aware(datetime.combine(date, time.min))
+    return queryset.filter(created_at__gt=aware_datetime)
+
+
+def filter_metadata(queryset, query_params):
+    """
+    Filter on ``metadata`` keys: ``year``, ``year_min``, ``year_max``,
+    ``imdb_rating_min``, ``rotten_tomatoes_min`` and ``actor``. Each filter is
+    served by one of the metadata indexes declared on ``Inventory``.
+    """
+    try:
+        year = parse_number(query_params, "year", int)
+        year_min = parse_number(query_params, "year_min", int)
+        year_max = parse_number(query_params, "year_max", int)
+        imdb_rating_min = parse_number(query_params, "imdb_rating_min", float)
+        rotten_tomatoes_min = parse_number(query_params, "rotten_tomatoes_min", int)
+    except ValueError:
+        return queryset.none()
+
+    if year is not None:
+        queryset = queryset.filter(metadata__year=year)
+    if year_min is not None:
+        queryset = queryset.filter(metadata__year__gte=year_min)
+    if year_max is not None:
+        queryset = queryset.filter(metadata__year__lte=year_max)
+    if imdb_rating_min is not None:
+        queryset = queryset.filter(metadata__imdb_rating__gte=imdb_rating_min)
+    if rotten_tomatoes_min is not None:
+        queryset = queryset.filter(
+            metadata__rotten_tomatoes_rating__gte=rotten_tomatoes_min
+        )
+
+    actor = query_params.get("actor")
+    if actor:
+        queryset = queryset.filter(metadata__contains={"actors": [actor]})
+
+    return queryset
+
+
+def filter_tags(queryset, query_params):
+    """
+    Filter on ``?tags=`` (comma separated tag ids), matching inventories with
+    any of them, or with all of them given ``?tags_match=all``. Both are
+    answered from the ``(inventorytag_id, inventory_id)`` index of the through
+    table: any-of as an ``EXISTS``, all-of as a ``GROUP BY ... HAVING COUNT``.
+    """
+    value = query_params.get("tags")
+    if not value:
+        return queryset
+
+    try:
+        tag_ids = {int(tag_id) for tag_id in value.split(",") if tag_id.strip()}
+    except ValueError:
+        return queryset.none()
+    match = query_params.get("tags_match", "any")
+    if not tag_ids or match not in ("any", "all"):
+        return queryset.none()
+
+    links = Inventory.tags.through.objects.filter(inventorytag_id__in=tag_ids)
+    if match == "any":
+        return queryset.filter(Exists(links.filter(inventory_id=OuterRef("pk"))))
+
+    tagged_with_all = (
+        links.values("inventory_id")
+        .annotate(matched=Count("inventorytag_id"))
+        .filter(matched=len(tag_ids))
+        .values("inventory_id")
+    )
+    return queryset.filter(pk__in=tagged_with_all)
+
+
+def parse_number(query_params, name, cast):
+    value = query_params.get(name)
+    if not value:
+        return None
+    number = cast(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{name} must be a finite number")
+    return number
+
+
 class InventoryListCreateView(APIView):
     queryset = Inventory.objects.all()
     serializer_class = InventorySerializer
     pagination_class = InventoryPagination
+    cursor_pagination_class = InventoryCursorPagination
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         try:
@@ -43,36 +165,66 @@ class InventoryListCreateView(APIView):
         return Response(serializer.data, status=201)
 
     def get(self, request: Request, *args, **kwargs) -> Response:
+        fieldset = inventory_fieldset(request)
         queryset = self.get_queryset()
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(queryset, request)
-        serializer = self.serializer_class(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        versions = [cache.get_generation()]
+        paginator = self.get_paginator()
+        # Aggregating over the whole queryset only pays off next to an exact
+        # count; otherwise the validators come from the page just read.
+        exact = paginator.counts_exactly(request)
+        if exact:
+            validators = conditional.queryset_validators(
+                request, queryset, versions=versions
+            )
+            response = conditional.not_modified(request, validators)
+            if response is not None:
+                return response
+
+        rows = inventory_values(queryset, fieldset)
+        page = paginator.paginate_queryset(rows, request)
+        if not exact:
+            validators = conditional.rows_validators(
+                request, page, versions=versions, parts=paginator.validator_parts()
+            )
+            response = conditional.not_modified(request, validators)
+            if response is not None:
+                return response
+
+        data = inventory_representations(page, fieldset)
+        return conditional.set_validators(
+            paginator.get_paginated_response(data), validators
+        )
+
+    def get_paginator(self):
+        if self.cursor_pagination_class.is_requested(self.request):
+            return self.cursor_pagination_class()
+        return self.pagination_class()
 
     def get_queryset(self):
         queryset = self.queryset.all()
         date_filter = self.request.query_params.get("created_after")
-        
-        if not date_filter:
-            return queryset
-
-        date = parse_date(date_filter)
-        if not date:
-            return queryset.none()
-
-        aware_datetime = make_aware(datetime.combine(date, time.min))
-        return queryset.filter(created_at__gt=aware_datetime)
+        queryset = filter_created_after(queryset, date_filter)
+        queryset = filter_metadata(queryset, self.request.query_params)
+        return filter_tags(queryset, self.request.query_params)
 
 
 class InventoryRetrieveUpdateDestroyView(APIView):
-    queryset = Inventory.objects.all()
+    queryset = Inventory.objects.select_related("type", "language")
     serializer_class = InventorySerializer
 
     def get(self, request: Request, *args, **kwargs) -> Response:
-        inventory = self.get_queryset(id=kwargs["id"])
-        serializer = self.serializer_class(inventory)
+        fieldset = inventory_fieldset(request)
+        row = inventory_values(self.queryset, fieldset).get(id=kwargs["id"])
+        validators = conditional.instance_validators(
+            request, row, versions=[cache.get_generation()]
+        )
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
 
-        return Response(serializer.data, status=200)
+        [data] = inventory_representations([row], fieldset)
+
+        return conditional.set_validators(Response(data, status=200), validators)
 
     def patch(self, request: Request, *args, **kwargs) -> Response:
         inventory = self.get_queryset(id=kwargs["id"])
@@ -94,6 +246,165 @@ class InventoryRetrieveUpdateDestroyView(APIView):
         return self.queryset.get(**kwargs)
 
 
+class InventoryMultiGetView(MultiGetView):
+    """Inventories by id, see ``MultiGetView``; supports sparse fieldsets."""
+
+    queryset = Inventory.objects.all()
+
+    def get_rows(self, ids):
+        self.fieldset = inventory_fieldset(self.request)
+        return inventory_values(self.queryset.filter(id__in=ids), self.fieldset)
+
+    def render(self, rows) -> list:
+        return inventory_representations(rows, self.fieldset)
+
+
+class InventoryBatchView(APIView):
+    serializer_class = InventoryBatchItemSerializer
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Create many inventories from a list of items in one transaction.
+
+        Invalid items are reported by index and skipped, unless ``?atomic=true``
+        is given, in which case any error rejects the whole batch.
+        """
+        items = request.data
+        if not isinstance(items, list):
+            return Response({"error": "Expected a list of items."}, status=400)
+
+        max_size = settings.INVENTORY_BATCH_MAX_SIZE
+        if len(items) > max_size:
+            return Response(
+                {"error": f"A batch holds at most {max_size} items."}, status=400
+            )
+
+        valid, errors = batch.validate_items(items, self.serializer_class())
+        atomic = request.query_params.get("atomic", "").lower() in ("1", "true")
+        if errors and atomic:
+            valid = {}
+        created = batch.create_inventories(valid.values())
+
+        return Response(
+            {
+                "created": [
+                    {"index": index, "id": inventory.id}
+                    for index, inventory in zip(valid, created)
+                ],
+                "errors": [
+                    {"index": index, "errors": detail}
+                    for index, detail in errors.items()
+                ],
+            },
+            status=201 if created or not errors else 400,
+        )
+
+
+class InventoryExportView(APIView):
+    """
+    Stream the whole catalogue as NDJSON, one inventory per line.
+
+    Rows are read through a server-side cursor in chunks of ``chunk_size`` and
+    the tags of each chunk are loaded with one query, so memory stays flat
+    regardless of the catalogue size. Supports the list filters and
+    ``?compress=gzip`` for an ``application/gzip`` file download.
+    """
+
+    queryset = Inventory.objects.all()
+    renderer_classes = [NDJSONRenderer, JSONRenderer]
+    chunk_size = 2000
+
+    def get(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        queryset = filter_created_after(
+            self.queryset.order_by("id"), request.query_params.get("created_after")
+        )
+        queryset = filter_metadata(queryset, request.query_params)
+        queryset = filter_tags(queryset, request.query_params)
+        lines = self.render_lines(inventory_values(queryset))
+
+        filename, content_type = "inventory.ndjson", NDJSON_MEDIA_TYPE
+        if request.query_params.get("compress") == "gzip":
+            # A gzip file to download, not a transfer encoding: clients must
+            # not decompress it on the fly and save it under the .gz name.
+            lines = gzip_stream(lines)
+            filename, content_type = f"{filename}.gz", GZIP_MEDIA_TYPE
+
+        response = StreamingHttpResponse(lines, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def render_lines(self, rows):
+        for data in render_chunks(rows, render_inventories, self.chunk_size):
+            yield ndjson_line(data)
+
+
+class InventorySearchView(APIView):
+    """
+    Ranked search over inventory names and ``metadata.actors``.
+
+    ``?q=`` is parsed as a web search query (quoted phrases, ``or``, ``-word``)
+    against the trigger-maintained ``search_vector``; trigram similarity on the
+    name adds typo tolerance. Both are served by GIN indexes and results are
+    paginated by keyset over ``(rank, id)``.
+    """
+
+    queryset = Inventory.objects.all()
+    pagination_class = InventorySearchPagination
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        term = request.query_params.get("q", "").strip()
+        if not term:
+            return Response({"error": "The q parameter is required."}, status=400)
+
+        paginator = self.pagination_class()
+        rows = self.get_queryset(term).values(*INVENTORY_VALUES, "rank")
+        page = paginator.paginate_queryset(rows, request)
+        data = [
+            {**inventory, "rank": row["rank"]}
+            for row, inventory in zip(page, cached_inventories(page))
+        ]
+        return paginator.get_paginated_response(data)
+
+    def get_queryset(self, term: str):
+        query = SearchQuery(term, config="simple", search_type="websearch")
+        return self.queryset.filter(
+            Q(search_vector=query) | Q(name__trigram_similar=term)
+        ).annotate(
+            # Double precision, so that the rank of a cursor round-trips exactly
+            # through its JSON float and matches the rows it came from.
+            rank=Cast(
+                SearchRank(F("search_vector"), query)
+                + TrigramSimilarity("name", term),
+                FloatField(),
+            )
+        )
+
+
+class InventoryAutocompleteView(AutocompleteView):
+    queryset = Inventory.objects.all()
+    cache_prefix = "inventory"
+
+
+class InventoryTagAutocompleteView(AutocompleteView):
+    queryset = InventoryTag.objects.all()
+    cache_prefix = "inventory-tag"
+
+
+class InventoryLanguageAutocompleteView(AutocompleteView):
+    queryset = InventoryLanguage.objects.all()
+    cache_prefix = "inventory-language"
+
+
+class InventoryTypeAutocompleteView(AutocompleteView):
+    queryset = InventoryType.objects.all()
+    cache_prefix = "inventory-type"
+
+
+class InventoryCacheStatsView(APIView):
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return Response(cache.stats(), status=200)
+
+
 class InventoryTagListCreateView(APIView):
     queryset = InventoryTag.objects.all()
     serializer_class = InventoryTagSerializer
@@ -108,9 +419,17 @@ class InventoryTagListCreateView(APIView):
         return Response(serializer.data, status=201)
 
     def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
+        queryset = self.get_queryset()
+        validators = conditional.queryset_validators(request, queryset)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
 
-        return Response(serializer.data, status=200)
+        serializer = self.serializer_class(queryset, many=True)
+
+        return conditional.set_validators(
+            Response(serializer.data, status=200), validators
+        )
 
     def get_queryset(self):
         return self.queryset.all()
@@ -122,9 +441,16 @@ class InventoryTagRetrieveUpdateDestroyView(APIView):
 
     def get(self, request: Request, *args, **kwargs) -> Response:
         inventory_tag = self.get_queryset(id=kwargs["id"])
+        validators = conditional.instance_validators(request, inventory_tag)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
+
         serializer = self.serializer_class(inventory_tag)
 
-        return Response(serializer.data, status=200)
+        return conditional.set_validators(
+            Response(serializer.data, status=200), validators
+        )
 
     def patch(self, request: Request, *args, **kwargs) -> Response:
         inventory_tag = self.get_queryset(id=kwargs["id"])
@@ -162,9 +488,17 @@ class InventoryLanguageListCreateView(APIView):
         return Response(serializer.data, status=201)
 
     def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
+        queryset = self.get_queryset()
+        validators = conditional.queryset_validators(request, queryset)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
 
-        return Response(serializer.data, status=200)
+        serializer = self.serializer_class(queryset, many=True)
+
+        return conditional.set_validators(
+            Response(serializer.data, status=200), validators
+        )
 
     def get_queryset(self):
         return self.queryset.all()
@@ -176,9 +510,16 @@ class InventoryLanguageRetrieveUpdateDestroyView(APIView):
 
     def get(self, request: Request, *args, **kwargs) -> Response:
         inventory = self.get_queryset(id=kwargs["id"])
+        validators = conditional.instance_validators(request, inventory)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
+
         serializer = self.serializer_class(inventory)
 
-        return Response(serializer.data, status=200)
+        return conditional.set_validators(
+            Response(serializer.data, status=200), validators
+        )
 
     def patch(self, request: Request, *args, **kwargs) -> Response:
         inventory = self.get_queryset(id=kwargs["id"])
@@ -214,9 +555,17 @@ class InventoryTypeListCreateView(APIView):
         return Response(serializer.data, status=201)
 
     def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
+        queryset = self.get_queryset()
+        validators = conditional.queryset_validators(request, queryset)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
 
-        return Response(serializer.data, status=200)
+        serializer = self.serializer_class(queryset, many=True)
+
+        return conditional.set_validators(
+            Response(serializer.data, status=200), validators
+        )
 
     def get_queryset(self):
         return self.queryset.all()
@@ -228,9 +577,16 @@ class InventoryTypeRetrieveUpdateDestroyView(APIView):
 
     def get(self, request: Request, *args, **kwargs) -> Response:
         inventory = self.get_queryset(id=kwargs["id"])
+        validators = conditional.instance_validators(request, inventory)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
+
         serializer = self.serializer_class(inventory)
 
-        return Response(serializer.data, status=200)
+        return conditional.set_validators(
+            Response(serializer.data, status=200), validators
+        )
 
     def patch(self, request: Request, *args, **kwargs) -> Response:
         inventory = self.get_queryset(id=kwargs["id"])
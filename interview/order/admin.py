@@ -5,6 +5,10 @@ from .models import Order, OrderTag
 class OrderAdmin(admin.ModelAdmin):
     list_display = ('id', 'inventory', 'is_active', 'start_date', 'embargo_date')
 
+    def get_queryset(self, request):
+        # Order.__str__ shows the inventory name, on every admin page.
+        return super().get_queryset(request).select_related('inventory')
+
 @admin.register(OrderTag)
 class OrderTagAdmin(admin.ModelAdmin):
     list_display = ('id', 'name', 'is_active')
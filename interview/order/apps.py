@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class OrderConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "interview.order"
+
+    def ready(self):
+        from interview.core import vocabulary
+        from interview.order import signals  # noqa: F401
+        from interview.order.models import VOCABULARY_VERSION, OrderTag
+
+        vocabulary.register(
+            OrderTag, VOCABULARY_VERSION, "order_tags", ("id", "name", "is_active")
+        )
@@ -0,0 +1,119 @@
+"""Set-based order writes, the order counterpart of ``interview.inventory.batch``."""
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from interview.inventory.batch import resolve_names
+from interview.inventory.models import Inventory
+from interview.order.models import (
+    Order,
+    OrderTag,
+    lock_inventories,
+    overlap_errors,
+)
+
+
+def resolve_inventories(names, known=None) -> dict:
+    """
+    Map inventory names to ids in a single query. Inventory names are not
+    unique, so the oldest inventory with a given name wins.
+    """
+    known = {} if known is None else known.setdefault(Inventory, {})
+    missing = set(names).difference(known)
+    if missing:
+        rows = (
+            Inventory.objects.filter(name__in=missing)
+            .order_by("-id")
+            .values_list("name", "id")
+        )
+        known.update(rows)
+    return known
+
+
+def validate_items(items, serializer, known=None) -> tuple[dict, dict]:
+    """
+    Validate ``items`` and resolve inventory and tag names, see
+    ``interview.inventory.batch.validate_items``. Valid entries are unsaved
+    ``Order`` instances carrying their tag ids in ``tag_ids``.
+    """
+    validated, errors = {}, {}
+    for index, item in enumerate(items):
+        try:
+            validated[index] = serializer.run_validation(item)
+        except ValidationError as e:
+            errors[index] = e.detail
+
+    values = validated.values()
+    inventories = resolve_inventories([item["inventory"] for item in values], known)
+    tags = resolve_names(
+        OrderTag, [tag for item in values for tag in item["tags"]], known
+    )
+
+    valid = {}
+    for index, item in validated.items():
+        item_errors = {}
+        if item["inventory"] not in inventories:
+            item_errors["inventory"] = [f"Unknown inventory '{item['inventory']}'."]
+        unknown_tags = [tag for tag in item["tags"] if tag not in tags]
+        if unknown_tags:
+            item_errors["tags"] = [
+                f"Unknown order tag '{tag}'." for tag in unknown_tags
+            ]
+        if item_errors:
+            errors[index] = item_errors
+            continue
+
+        order = Order(
+            inventory_id=inventories[item["inventory"]],
+            start_date=item["start_date"],
+            embargo_date=item["embargo_date"],
+            is_active=item["is_active"],
+        )
+        order.tag_ids = list(dict.fromkeys(tags[tag] for tag in item["tags"]))
+        valid[index] = order
+
+    return valid, dict(sorted(errors.items()))
+
+
+def create_orders(orders: dict, batch_size=None) -> tuple[list, dict]:
+    """
+    Insert ``orders`` (keyed by item index, see ``validate_items``) and their
+    tag links in one transaction. Active orders are checked for overlaps
+    under the lock of their inventories (see ``lock_inventories``); those
+    overlapping are not inserted. Returns the created orders and the errors
+    by index.
+    """
+    through = Order.tags.through
+    with transaction.atomic():
+        lock_inventories(
+            order.inventory_id for order in orders.values() if order.is_active
+        )
+        errors = {
+            index: {api_settings.NON_FIELD_ERRORS_KEY: [message]}
+            for index, message in overlap_errors(orders).items()
+        }
+        created = [order for index, order in orders.items() if index not in errors]
+        Order.objects.bulk_create(created, batch_size=batch_size)
+        through.objects.bulk_create(
+            [
+                through(order_id=order.id, ordertag_id=tag_id)
+                for order in created
+                for tag_id in order.tag_ids
+            ],
+            batch_size=batch_size,
+        )
+    return created, errors
+
+
+def activate_orders(queryset) -> int:
+    """
+    ``Order.activate`` for the API: the overlaps it rejects are raised as a
+    ``ValidationError`` listing the conflicting ids, and nothing is activated.
+    """
+    try:
+        return Order.activate(queryset)
+    except DjangoValidationError as e:
+        # A single overlap message per conflicting order.
+        conflicts = {pk: messages[0] for pk, messages in e.message_dict.items()}
+        raise ValidationError({"conflicts": conflicts})
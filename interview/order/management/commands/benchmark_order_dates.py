@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from interview.inventory.models import Inventory
+from interview.order.models import Order
+
+INDEX_NAME = "order_start_embargo_idx"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the plans of the order list date window query with and without "
+        f"{INDEX_NAME} on a synthetic orders table. Rows are seeded with "
+        "generate_series inside a transaction that is rolled back, but the "
+        "table is locked meanwhile: do not run against a live database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2_000_000)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Width of the queried window, in days.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("The benchmark needs PostgreSQL.")
+        if options["rows"] <= 0 or options["days"] <= 0:
+            raise CommandError("--rows and --days must be positive.")
+        inventory = Inventory.objects.order_by("id").first()
+        if inventory is None:
+            raise CommandError("Seed at least one inventory first.")
+
+        # Windows of up to 60 days starting over ~25 years.
+        first_day = date(2000, 1, 1)
+        start = first_day + timedelta(days=4500)
+        end = start + timedelta(days=options["days"])
+        queryset = Order.objects.within(start, end)
+
+        with transaction.atomic():
+            self.seed(inventory.id, first_day, options["rows"])
+            with_index = queryset.explain(analyze=True)
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP INDEX {INDEX_NAME}")
+            without_index = queryset.explain(analyze=True)
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"Window {start} to {end} over {options['rows']} orders.")
+        self.stdout.write(self.style.MIGRATE_HEADING("Without index:"))
+        self.stdout.write(without_index)
+        self.stdout.write(self.style.MIGRATE_HEADING(f"With {INDEX_NAME}:"))
+        self.stdout.write(with_index)
+
+    def seed(self, inventory_id: int, first_day: date, rows: int) -> None:
+        table = Order._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table}
+                    (inventory_id, start_date, embargo_date, is_active,
+                     created_at, updated_at)
+                SELECT %s, day, day + (random() * 60)::int, random() < 0.8,
+                       now(), now()
+                FROM (
+                    SELECT %s::date + (random() * 9000)::int AS day
+                    FROM generate_series(1, %s)
+                ) AS days
+                """,
+                [inventory_id, first_day, rows],
+            )
+            cursor.execute(f"ANALYZE {table}")
@@ -0,0 +1,23 @@
+from interview.core.importing import BaseImportCommand, split_list
+from interview.order import batch
+from interview.order.serializers import OrderBatchItemSerializer
+
+
+class Command(BaseImportCommand):
+    help = (
+        "Bulk import orders from CSV (columns: inventory name, start_date, "
+        "embargo_date, tags separated by '|', is_active) or NDJSON."
+    )
+    serializer_class = OrderBatchItemSerializer
+
+    def parse_csv_row(self, row: dict) -> dict:
+        item = dict(row, tags=split_list(row.get("tags", "")))
+        if not item.get("is_active"):
+            item.pop("is_active", None)
+        return item
+
+    def write_batch(self, items, serializer) -> tuple[int, dict]:
+        valid, errors = batch.validate_items(items, serializer, self.known)
+        created, overlaps = batch.create_orders(valid)
+        errors.update(overlaps)
+        return len(created), dict(sorted(errors.items()))
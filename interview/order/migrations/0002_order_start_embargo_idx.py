@@ -0,0 +1,23 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:27
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY does not lock out writes to the orders table
+    # while it is built, but cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("order", "0001_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                fields=["start_date", "embargo_date"], name="order_start_embargo_idx"
+            ),
+        ),
+    ]
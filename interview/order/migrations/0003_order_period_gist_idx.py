@@ -0,0 +1,37 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:28
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Built concurrently, like order_start_embargo_idx.
+    atomic = False
+
+    dependencies = [
+        ("order", "0002_order_start_embargo_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.GistIndex(
+                models.Case(
+                    models.When(
+                        start_date__lte=models.F("embargo_date"),
+                        then=models.Func(
+                            models.F("start_date"),
+                            models.F("embargo_date"),
+                            models.Value("[]"),
+                            function="daterange",
+                        ),
+                    ),
+                    default=models.Value("empty"),
+                    output_field=django.contrib.postgres.fields.ranges.DateRangeField(),
+                ),
+                name="order_period_gist_idx",
+            ),
+        ),
+    ]
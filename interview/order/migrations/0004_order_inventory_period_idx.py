@@ -0,0 +1,39 @@
+# Generated by Django 4.1.7 on 2026-10-18 20:30
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGistExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("order", "0003_order_period_gist_idx"),
+    ]
+
+    operations = [
+        # GiST operator class for the integer inventory_id column.
+        BtreeGistExtension(),
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.GistIndex(
+                models.F("inventory"),
+                models.Case(
+                    models.When(
+                        start_date__lte=models.F("embargo_date"),
+                        then=models.Func(
+                            models.F("start_date"),
+                            models.F("embargo_date"),
+                            models.Value("[]"),
+                            function="daterange",
+                        ),
+                    ),
+                    default=models.Value("empty"),
+                    output_field=django.contrib.postgres.fields.ranges.DateRangeField(),
+                ),
+                name="order_inventory_period_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Composite index on the auto-created tags through table, leading with the
+    tag so the orders of a tag are read from the index in id order, which
+    keyset pages and streams of ``OrdersByTagView`` follow.
+    """
+
+    # Built concurrently, like order_start_embargo_idx.
+    atomic = False
+
+    dependencies = [
+        ("order", "0004_order_inventory_period_idx"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS order_tags_tag_order_idx "
+            "ON order_order_tags (ordertag_id, order_id);",
+            "DROP INDEX CONCURRENTLY IF EXISTS order_tags_tag_order_idx;",
+        ),
+    ]
@@ -1,14 +1,106 @@
-from django.db import models
+from collections import defaultdict
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GistIndex
+from django.core.exceptions import ValidationError
+from django.db import connections, models, transaction
+from psycopg2.extras import DateRange
 
 from interview.core.behaviors import IsActiveModel, TimestampedModel, UniqueNameModel
 from interview.inventory.models import Inventory
 
+# Version stamp (see interview.core.versions) bumped whenever an OrderTag changes.
+VOCABULARY_VERSION = "order-vocabulary"
+
+
+def order_period():
+    """
+    The ``[start_date, embargo_date]`` window of an order as a ``daterange``.
+    Orders whose embargo precedes their start are never live: their window is
+    the empty range rather than an error from ``daterange()``.
+    """
+    return models.Case(
+        models.When(
+            start_date__lte=models.F("embargo_date"),
+            then=models.Func(
+                models.F("start_date"),
+                models.F("embargo_date"),
+                models.Value("[]"),
+                function="daterange",
+            ),
+        ),
+        default=models.Value("empty"),
+        output_field=DateRangeField(),
+    )
+
 
 class OrderTag(UniqueNameModel, TimestampedModel, IsActiveModel, models.Model):
     def __str__(self) -> str:
         return self.name
 
 
+class OrderQuerySet(models.QuerySet):
+    def within(self, start, end):
+        """
+        Orders starting on or after ``start`` with an embargo on or before
+        ``end``, served by ``order_start_embargo_idx``. Inverted windows
+        (embargo before start, as ``database.py`` seeds one) match on the
+        same two bounds.
+        """
+        return self.filter(start_date__gte=start, embargo_date__lte=end)
+
+    def overlapping(self, windows):
+        """
+        Active orders overlapping any of the ``(inventory_id, start, end)``
+        windows, found through ``order_inventory_period_idx`` on Postgres.
+        Inverted windows overlap nothing.
+        """
+        postgres = connections[self.db].vendor == "postgresql"
+        condition = models.Q()
+        for inventory_id, start, end in windows:
+            if start > end:
+                continue
+            if postgres:
+                window = models.Q(period__overlap=DateRange(start, end, "[]"))
+            else:
+                # The same predicate without range types, for other backends.
+                window = models.Q(
+                    models.Q(start_date__lte=models.F("embargo_date")),
+                    start_date__lte=end,
+                    embargo_date__gte=start,
+                )
+            condition |= models.Q(window, inventory_id=inventory_id)
+        if not condition:
+            return self.none()
+        queryset = self.filter(is_active=True)
+        if postgres:
+            queryset = queryset.alias(period=order_period())
+        return queryset.filter(condition)
+
+    def conflicting(self):
+        """
+        Active orders overlapping another active order of the same inventory,
+        with the ids of those orders in ``conflicts``. Each order probes the
+        index once, so this is not a pairwise comparison of the orders.
+        """
+        others = (
+            Order.objects.filter(is_active=True)
+            .alias(period=order_period())
+            .filter(
+                inventory_id=models.OuterRef("inventory_id"),
+                period__overlap=models.OuterRef("period"),
+            )
+            .exclude(id=models.OuterRef("id"))
+        )
+        return (
+            self.filter(is_active=True)
+            .alias(period=order_period())
+            .filter(models.Exists(others))
+            .annotate(conflicts=ArraySubquery(others.order_by("id").values("id")))
+        )
+
+
 class Order(TimestampedModel, IsActiveModel, models.Model):
     inventory = models.ForeignKey(
         Inventory, on_delete=models.CASCADE, related_name="orders"
@@ -17,5 +109,148 @@ class Order(TimestampedModel, IsActiveModel, models.Model):
     embargo_date = models.DateField()
     tags = models.ManyToManyField(OrderTag, related_name="orders")
 
+    objects = OrderQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Date window filter of the order list: a range scan on start_date
+            # with embargo_date checked from the index.
+            models.Index(
+                fields=["start_date", "embargo_date"], name="order_start_embargo_idx"
+            ),
+            # Point-in-time and overlap queries (``@>`` and ``&&``) on the
+            # window; they must filter on ``order_period()`` to use it.
+            GistIndex(order_period(), name="order_period_gist_idx"),
+            # Overlap with the orders of one inventory (conflict detection).
+            GistIndex(
+                models.F("inventory"), order_period(), name="order_inventory_period_idx"
+            ),
+        ]
+
+    def clean(self):
+        self.check_overlaps()
+
+    def save(self, *args, **kwargs):
+        """
+        Active orders are checked for overlaps and saved under the lock of
+        their inventory (see ``lock_inventories``), so two writers cannot both
+        pass the check. Raises ``ValidationError`` on an overlap.
+        """
+        if not self.is_active:
+            return super().save(*args, **kwargs)
+        with transaction.atomic():
+            lock_inventories([self.inventory_id])
+            self.check_overlaps()
+            return super().save(*args, **kwargs)
+
+    def check_overlaps(self):
+        if not self.is_active or self.start_date is None or self.embargo_date is None:
+            return
+        # Range bounds are not converted by the lookup: datetimes must become
+        # dates here, there is no daterange(timestamp, timestamp).
+        start = self._meta.get_field("start_date").to_python(self.start_date)
+        end = self._meta.get_field("embargo_date").to_python(self.embargo_date)
+        window = (self.inventory_id, start, end)
+        conflicts = Order.objects.overlapping([window]).exclude(pk=self.pk)
+        ids = list(conflicts.order_by("id").values_list("id", flat=True))
+        if ids:
+            raise ValidationError(overlap_message(ids))
+
+    @classmethod
+    def set_active(cls, pks, is_active: bool) -> int:
+        """
+        ``IsActiveModel.set_active`` keeping the overlap rule of ``save``: the
+        orders to activate are checked, against active orders and against each
+        other, under the lock of their inventories. Raises ``ValidationError``,
+        keyed by the ids of the conflicting orders, and activates nothing if
+        any of them overlaps.
+        """
+        if not is_active:
+            return super().set_active(pks, is_active)
+        with transaction.atomic():
+            pending = cls.get_selection(pks).filter(is_active=False).order_by("id")
+            lock_inventories(pending.values_list("inventory_id", flat=True).distinct())
+            orders = {
+                order.id: order
+                for order in pending.only(
+                    "id", "inventory", "start_date", "embargo_date"
+                )
+            }
+            for order in orders.values():
+                order.is_active = True
+            conflicts = overlap_errors(orders)
+            if conflicts:
+                raise ValidationError(conflicts)
+            return super().set_active(list(orders), is_active)
+
     def __str__(self) -> str:
-        return f"{self.inventory.name} - {self.start_date}"
+        # The inventory name is only used when already loaded, so that
+        # printing an order (admin, logs) never queries.
+        if Order.inventory.is_cached(self):
+            return f"{self.inventory.name} - {self.start_date}"
+        return f"Order {self.pk} - {self.start_date}"
+
+
+def overlap_message(ids) -> str:
+    return f"Overlaps active order(s) {', '.join(map(str, ids))} of the inventory."
+
+
+def lock_inventories(inventory_ids) -> None:
+    """
+    Lock the rows of the inventories ``inventory_ids`` until the end of the
+    transaction, in id order. Writers of active orders take it before their
+    overlap check, which serializes them per inventory.
+    """
+    inventories = Inventory.objects.select_for_update().filter(
+        id__in=set(inventory_ids)
+    )
+    list(inventories.order_by("id").values_list("id", flat=True))
+
+
+def overlap_errors(orders: dict) -> dict:
+    """
+    Messages for the active ``orders`` (keyed by item index or id) overlapping
+    an active order of their inventory, either stored or earlier in the batch.
+
+    Stored orders are found with one indexed query for the whole batch and
+    the batch is checked by sweeping each inventory's windows sorted by start,
+    so no two lists of orders are compared pairwise.
+    """
+    active = {
+        index: order
+        for index, order in orders.items()
+        if order.is_active and order.start_date <= order.embargo_date
+    }
+    windows = [
+        (order.inventory_id, order.start_date, order.embargo_date)
+        for order in active.values()
+    ]
+    stored = defaultdict(list)
+    rows = Order.objects.overlapping(windows).order_by("id")
+    for row in rows.values("id", "inventory_id", "start_date", "embargo_date"):
+        stored[row["inventory_id"]].append(row)
+
+    messages = {}
+    by_inventory = defaultdict(list)
+    for index, order in active.items():
+        ids = [
+            row["id"]
+            for row in stored[order.inventory_id]
+            if row["start_date"] <= order.embargo_date
+            and order.start_date <= row["embargo_date"]
+        ]
+        if ids:
+            messages[index] = overlap_message(ids)
+        else:
+            by_inventory[order.inventory_id].append(index)
+
+    for indexes in by_inventory.values():
+        indexes.sort(key=lambda index: (active[index].start_date, index))
+        latest = None
+        for index in indexes:
+            order = active[index]
+            if latest is not None and order.start_date <= active[latest].embargo_date:
+                messages[index] = "Overlaps another active order of the batch."
+            else:
+                latest = index
+    return messages
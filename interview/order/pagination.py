@@ -0,0 +1,37 @@
+from interview.core.pagination import CountStrategyPagination, KeysetPagination
+
+
+class OrderPagination(CountStrategyPagination):
+    """Opt-in pagination: orders are only paginated when ``?limit=`` is given."""
+
+    default_limit = None
+    max_limit = 100
+
+
+class OrderPeriodPagination(OrderPagination):
+    """Point-in-time and overlap queries can match most orders: always paged."""
+
+    default_limit = 20
+
+
+class OrderKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination over ids for the unbounded related lists (orders of a
+    tag, tags of an order), served by the order-tags through table indexes.
+    """
+
+    default_limit = 50
+    max_limit = OrderPagination.max_limit
+
+    def parse_value(self, field: str, value):
+        return int(value)
+
+
+class TagOrdersPagination(OrderKeysetPagination):
+    """
+    Keyset pagination of the order-tags through table rows of one tag by
+    ``order_id``, so the cursor bound is applied to the column of
+    ``order_tags_tag_order_idx`` and a page is a range scan of that index.
+    """
+
+    ordering = ("order_id",)
@@ -0,0 +1,127 @@
+"""
+Lean, read-only rendering of orders from ``values()`` rows, producing exactly
+the JSON shape of ``OrderSerializer``. Nested inventories are rendered by
+``interview.inventory.representations`` through the representation cache.
+With a sparse fieldset (see ``interview.core.fieldsets``) inventories and tags
+are only loaded when requested and expanded.
+
+Full order representations are cached as JSON fragments in the inventory
+representation cache, keyed by the order and inventory ``updated_at`` and by
+the version stamps of both vocabularies.
+"""
+from collections import defaultdict
+
+from interview.core.fieldsets import Fieldset
+from interview.core.fragments import FragmentList, cached_fragments
+from interview.core.versions import get_version
+from interview.core.vocabulary import get_vocabulary
+from interview.inventory import cache as inventory_cache
+from interview.inventory.models import Inventory
+from interview.inventory.representations import cached_inventories, inventory_values
+from interview.order.models import VOCABULARY_VERSION, Order, OrderTag
+
+ORDER_VALUES = (
+    "id",
+    "inventory_id",
+    "start_date",
+    "embargo_date",
+    "is_active",
+    "updated_at",
+    "inventory__updated_at",
+)
+
+ORDER_FIELDS = ("id", "inventory", "start_date", "embargo_date", "tags", "is_active")
+ORDER_RELATIONS = ("inventory", "tags")
+
+
+def order_fieldset(request) -> Fieldset:
+    return Fieldset.from_request(request, ORDER_FIELDS, ORDER_RELATIONS)
+
+
+def order_values(queryset):
+    return queryset.values(*ORDER_VALUES)
+
+
+def tags_by_order(order_ids) -> dict:
+    """Tag representations of each order, in tag id order, in one query."""
+    rows = list(
+        Order.tags.through.objects.filter(order_id__in=order_ids)
+        .order_by("ordertag_id")
+        .values_list("order_id", "ordertag_id")
+    )
+    vocabulary = get_vocabulary(OrderTag).get_many(tag_id for _, tag_id in rows)
+    tags = defaultdict(list)
+    for order_id, tag_id in rows:
+        tag = vocabulary.get(tag_id)
+        if tag is None:
+            # Deleted since the links were read.
+            continue
+        tags[order_id].append(
+            {"id": tag_id, "name": tag["name"], "is_active": tag["is_active"]}
+        )
+    return tags
+
+
+def inventories_by_id(inventory_ids) -> dict:
+    queryset = Inventory.objects.filter(id__in=set(inventory_ids))
+    return {data["id"]: data for data in cached_inventories(inventory_values(queryset))}
+
+
+def render_order(row, inventory, tags) -> dict:
+    return {
+        "id": row["id"],
+        "inventory": inventory,
+        "start_date": row["start_date"].isoformat(),
+        "embargo_date": row["embargo_date"].isoformat(),
+        "tags": tags,
+        "is_active": row["is_active"],
+    }
+
+
+def render_orders(rows, fieldset=None) -> list:
+    rows = list(rows)
+    if fieldset is None or fieldset.expands("inventory"):
+        inventories = inventories_by_id([row["inventory_id"] for row in rows])
+    else:
+        # Collapsed to its id, the inventory is never loaded.
+        inventories = {row["inventory_id"]: {"id": row["inventory_id"]} for row in rows}
+    if fieldset is None or "tags" in fieldset:
+        tags = tags_by_order([row["id"] for row in rows])
+    else:
+        tags = {}
+    data = [
+        render_order(row, inventories[row["inventory_id"]], tags.get(row["id"], []))
+        for row in rows
+    ]
+    if fieldset is None or fieldset.complete:
+        return data
+    return [fieldset.project(item) for item in data]
+
+
+def order_fragment_key(versions, row) -> str:
+    return (
+        f"order:repr:{versions[0]}:{versions[1]}:{row['id']}:"
+        f"{row['updated_at'].timestamp()}:{row['inventory__updated_at'].timestamp()}"
+    )
+
+
+def cached_orders(rows) -> FragmentList:
+    """``render_orders`` through the fragment cache."""
+    rows = list(rows)
+    versions = (get_version(VOCABULARY_VERSION), inventory_cache.get_generation())
+    keys = [order_fragment_key(versions, row) for row in rows]
+    fragments, _ = cached_fragments(
+        rows,
+        keys,
+        render_orders,
+        inventory_cache.get_cache(),
+        inventory_cache.get_timeout(),
+    )
+    return fragments
+
+
+def order_representations(rows, fieldset: Fieldset) -> list:
+    """Cached fragments for the full representation, see ``render_orders``."""
+    if fieldset.complete:
+        return cached_orders(rows)
+    return render_orders(rows, fieldset)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from interview.inventory.serializers import InventorySerializer
 
@@ -17,3 +18,57 @@ class OrderSerializer(serializers.ModelSerializer):
     class Meta:
         model = Order
         fields = ["id", "inventory", "start_date", "embargo_date", "tags", "is_active"]
+
+
+class OrderBatchItemSerializer(serializers.Serializer):
+    """One item of a bulk order write; inventory and tags are given by name."""
+
+    inventory = serializers.CharField(max_length=255)
+    start_date = serializers.DateField()
+    embargo_date = serializers.DateField()
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=255), default=list
+    )
+    is_active = serializers.BooleanField(default=True)
+
+
+class OrderSelectionSerializer(serializers.Serializer):
+    """
+    The orders of a bulk state change: explicit ``ids`` and/or a filter on
+    ``tag``, ``inventory`` and the ``start``/``end`` window of the order list.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.ORDER_STATE_MAX_IDS,
+    )
+    tag = serializers.IntegerField(required=False)
+    inventory = serializers.IntegerField(required=False)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError(
+                "Select orders by ids, tag, inventory or start and end."
+            )
+        if ("start" in attrs) != ("end" in attrs):
+            raise serializers.ValidationError("Give both start and end.")
+        return attrs
+
+    def get_queryset(self):
+        selection = self.validated_data
+        queryset = Order.objects.all()
+        if "ids" in selection:
+            queryset = queryset.filter(id__in=selection["ids"])
+        if "tag" in selection:
+            queryset = queryset.filter(tags=selection["tag"])
+        if "inventory" in selection:
+            queryset = queryset.filter(inventory_id=selection["inventory"])
+        if "start" in selection:
+            queryset = queryset.filter(
+                start_date__gte=selection["start"], embargo_date__lte=selection["end"]
+            )
+        return queryset
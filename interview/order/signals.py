@@ -0,0 +1,35 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from interview.core.signals import active_changed
+from interview.core.versions import bump_version
+from interview.order.models import VOCABULARY_VERSION, Order, OrderTag
+
+
+@receiver(m2m_changed, sender=Order.tags.through)
+def touch_order_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """Tag changes do not go through ``Order.save``, so touch ``updated_at``."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        pks = [instance.pk]
+    elif pk_set:
+        pks = list(pk_set)
+    else:
+        # Clearing from the tag side does not report the affected orders.
+        bump_version(VOCABULARY_VERSION)
+        return
+
+    now = timezone.now()
+    Order.objects.filter(pk__in=pks).update(updated_at=now)
+    if not reverse:
+        instance.updated_at = now
+
+
+@receiver(post_save, sender=OrderTag)
+@receiver(post_delete, sender=OrderTag)
+@receiver(active_changed, sender=OrderTag)
+def bump_order_vocabulary(sender, **kwargs):
+    bump_version(VOCABULARY_VERSION)
@@ -1,15 +1,79 @@
-from datetime import date, timedelta
+import json
+import os
+import re
+import tempfile
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from unittest import skipUnless
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib import admin
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Prefetch
 from rest_framework import status
-
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from interview.core.vocabulary import get_vocabulary
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
 from interview.tests.api_request_factory import APIViewRequestFactory
 from interview.order.views import (
+    OrderStateView,
+    OrderConflictsView,
     OrderListCreateView,
+    OrderMultiGetView,
     DeactivateOrderView,
+    OrderTagListCreateView,
     OrderTagsView,
     OrdersByTagView,
 )
 from interview.order.serializers import OrderSerializer, OrderTagSerializer
+from interview.order.admin import OrderAdmin
 from interview.order.models import Order, OrderTag
+from interview.order.representations import order_values, render_orders
+
+
+def add_orders(count: int, tag: OrderTag):
+    """``count`` orders tagged ``tag``, each on a new inventory with a tag."""
+    template = Inventory.objects.get(name="The Matrix")
+    inventory_tag = InventoryTag.objects.get()
+    for number in range(count):
+        inventory = Inventory.objects.create(
+            name=f"The Matrix {number}",
+            type=template.type,
+            language=template.language,
+            metadata={},
+        )
+        inventory.tags.add(inventory_tag)
+        order = Order.objects.create(
+            inventory=inventory, start_date=date.today(), embargo_date=date.today()
+        )
+        order.tags.add(tag)
+
+
+def serialized_orders(queryset):
+    """``OrderSerializer`` output with tags in id order, as rendered."""
+    queryset = queryset.prefetch_related(
+        Prefetch("inventory__tags", queryset=InventoryTag.objects.order_by("id")),
+        Prefetch("tags", queryset=OrderTag.objects.order_by("id")),
+    )
+    return OrderSerializer(queryset, many=True).data
+
+
+def cold_caches():
+    """Drop every cached representation, keeping the vocabularies loaded."""
+    for cache in caches.all():
+        cache.clear()
+    for model in (InventoryType, InventoryLanguage, InventoryTag, OrderTag):
+        get_vocabulary(model).load()
 
 
 class TestOrderListCreateView(APIViewRequestFactory):
@@ -23,6 +87,111 @@ class TestOrderListCreateView(APIViewRequestFactory):
         self.assertEqual(response.data, serializer.data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_orders_list_is_stitched_from_cached_fragments(self):
+        serialized = OrderSerializer(Order.objects.all(), many=True).data
+        self.send_request_to_view(method="get")
+
+        response = self.send_request_to_view(method="get")
+
+        self.assertEqual(response.render().content, JSONRenderer().render(serialized))
+        self.assertFalse(response.data.decoded)
+
+    def test_orders_list_query_budget(self):
+        # version stamps, validators, orders, inventories, their documents and
+        # order tag links: the same plan for any number of orders, on a cold
+        # cache.
+        tag = OrderTag.objects.get()
+        for count in (2, 5):
+            add_orders(count, tag)
+            cold_caches()
+            with self.assertNumQueries(6):
+                response = self.send_request_to_view(method="get")
+            self.assertEqual(
+                response.data,
+                serialized_orders(Order.objects.all()),
+            )
+
+    def test_orders_list_conditional_get(self):
+        response = self.send_request_to_view(method="get")
+        headers = {"HTTP_IF_NONE_MATCH": response["ETag"]}
+
+        # version stamps and validators
+        with self.assertNumQueries(2):
+            response = self.send_request_to_view(method="get", headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Order.objects.first().tags.add(OrderTag.objects.create(name="Urgent"))
+        response = self.send_request_to_view(method="get", headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_orders_list_conditional_get_without_exact_count(self):
+        query_params = {"limit": 1, "count": "none"}
+        response = self.send_request_to_view(method="get", query_params=query_params)
+        headers = {"HTTP_IF_NONE_MATCH": response["ETag"]}
+
+        # version stamps and page, no aggregate over the whole list
+        with self.assertNumQueries(2):
+            response = self.send_request_to_view(
+                method="get", query_params=query_params, headers=headers
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        order = Order.objects.order_by("id").first()
+        order.inventory.save()
+        response = self.send_request_to_view(
+            method="get", query_params=query_params, headers=headers
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_orders_list_with_limit_is_paginated(self):
+        response = self.send_request_to_view(
+            method="get", query_params={"limit": 1, "count": "none"}
+        )
+
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["count_strategy"], "none")
+        self.assertTrue(response.data["has_next"])
+        self.assertIn("offset=1", response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_browsable_orders_list_without_count(self):
+        response = self.send_request_to_view(
+            method="get",
+            query_params={"limit": 1, "count": "none"},
+            headers={"HTTP_ACCEPT": "text/html"},
+        )
+        content = response.render().content
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b'<ul class="pagination"', content)
+
+    def test_orders_list_with_sparse_fieldset(self):
+        order = Order.objects.order_by("id").first()
+        tag = order.tags.get()
+        get_vocabulary(OrderTag).load()
+
+        # version stamps, validators, orders and tag links: the inventories are
+        # not loaded
+        with self.assertNumQueries(4):
+            response = self.send_request_to_view(
+                method="get",
+                query_params={"fields": "id,inventory,tags", "expand": "tags"},
+            )
+
+        self.assertEqual(
+            response.data[0],
+            {
+                "id": order.id,
+                "inventory": order.inventory_id,
+                "tags": [{"id": tag.id, "name": tag.name, "is_active": True}],
+            },
+        )
+
+        response = self.send_request_to_view(
+            method="get", query_params={"fields": "id,owner"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_orders_list_with_valid_dates(self):
         start = date.today().isoformat()
         end = (date.today() + timedelta(days=7)).isoformat()
@@ -33,6 +202,25 @@ class TestOrderListCreateView(APIViewRequestFactory):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_orders_list_within_window_keeps_inverted_windows(self):
+        first = Order.objects.order_by("id").first()
+        # An inverted window ending in [start, end] but starting after it.
+        inverted = Order.objects.create(
+            inventory=first.inventory,
+            start_date=date.today() + timedelta(days=30),
+            embargo_date=date.today() + timedelta(days=3),
+        )
+        start = date.today().isoformat()
+        end = (date.today() + timedelta(days=7)).isoformat()
+
+        response = self.send_request_to_view(
+            method="get", query_params={"start": start, "end": end}
+        )
+
+        self.assertEqual(
+            sorted(order["id"] for order in response.data), [first.id, inverted.id]
+        )
+
     def test_orders_list_with_invalid_dates(self):
         start = date.today().isoformat()
         end = (date.today() + timedelta(days=7)).isoformat()
@@ -43,6 +231,111 @@ class TestOrderListCreateView(APIViewRequestFactory):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_orders_list_with_invalid_mode(self):
+        response = self.send_request_to_view(
+            method="get", query_params={"mode": "during"}
+        )
+
+        self.assertIn("mode", response.data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_orders_list_on_invalid_date_is_empty(self):
+        response = self.send_request_to_view(method="get", query_params={"on": "soon"})
+
+        self.assertEqual(response.data["results"], [])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @skipUnless(connection.vendor == "postgresql", "Range queries need Postgres")
+    def test_orders_list_on_date(self):
+        live = Order.objects.get(embargo_date=date.today() + timedelta(days=10))
+        # An inverted window is never live rather than an error.
+        Order.objects.create(
+            inventory=live.inventory,
+            start_date=date.today() + timedelta(days=9),
+            embargo_date=date.today(),
+        )
+        day = (date.today() + timedelta(days=7)).isoformat()
+
+        response = self.send_request_to_view(method="get", query_params={"on": day})
+
+        self.assertEqual([row["id"] for row in response.data["results"]], [live.id])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @skipUnless(connection.vendor == "postgresql", "Range queries need Postgres")
+    def test_orders_list_overlapping_window(self):
+        live = Order.objects.get(embargo_date=date.today() + timedelta(days=10))
+        query_params = {
+            "start": (date.today() + timedelta(days=6)).isoformat(),
+            "end": (date.today() + timedelta(days=20)).isoformat(),
+            "mode": "overlap",
+            "limit": 1,
+        }
+
+        response = self.send_request_to_view(method="get", query_params=query_params)
+
+        self.assertEqual([row["id"] for row in response.data["results"]], [live.id])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestOrderMultiGetView(APIViewRequestFactory):
+    view_name = OrderMultiGetView
+
+    def test_multi_get_orders(self):
+        first, second = Order.objects.order_by("id")
+        ids = f"{second.id},{first.id + second.id},{first.id}"
+
+        response = self.send_request_to_view(method="get", query_params={"ids": ids})
+
+        self.assertEqual(
+            response.data["results"], OrderSerializer([second, first], many=True).data
+        )
+        self.assertEqual(response.data["missing"], [first.id + second.id])
+
+        response = self.send_request_to_view(
+            method="get", query_params={"ids": ids, "fields": "id"}
+        )
+        self.assertEqual(
+            response.data["results"], [{"id": second.id}, {"id": first.id}]
+        )
+
+
+@skipUnless(connection.vendor == "postgresql", "Range queries need Postgres")
+class TestOrderConflictsView(APIViewRequestFactory):
+    view_name = OrderConflictsView
+
+    def setUp(self):
+        # Saving refuses overlapping active orders, a queryset update does
+        # not: these are the rows stored before the check existed.
+        first, second = Order.objects.order_by("id")
+        Order.objects.filter(id=second.id).update(start_date=first.start_date)
+
+    def test_conflicts(self):
+        first, second = Order.objects.order_by("id")
+        Order.objects.create(
+            inventory=first.inventory,
+            start_date=date.today() + timedelta(days=20),
+            embargo_date=date.today() + timedelta(days=30),
+        )
+
+        response = self.send_request_to_view(
+            method="get", query_params={"inventory": first.inventory_id}
+        )
+
+        self.assertEqual(
+            [(row["id"], row["conflicts"]) for row in response.data["results"]],
+            [(first.id, [second.id]), (second.id, [first.id])],
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_inactive_orders_do_not_conflict(self):
+        Order.objects.filter(id=Order.objects.order_by("id")[0].id).update(
+            is_active=False
+        )
+
+        response = self.send_request_to_view(method="get")
+
+        self.assertEqual(response.data["results"], [])
+
 
 class TestOrdersByTagView(APIViewRequestFactory):
     view_name = OrdersByTagView
@@ -55,9 +348,98 @@ class TestOrdersByTagView(APIViewRequestFactory):
         response = self.send_request_to_view(method="get", path_params=path_params)
         serializer = OrderSerializer(orders, many=True)
 
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data["results"], serializer.data)
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_orders_list_by_tag_walks_pages_by_id(self):
+        tag = OrderTag.objects.get()
+        add_orders(3, tag)
+        expected_ids = list(tag.orders.order_by("id").values_list("id", flat=True))
+
+        query_params = {"limit": 2}
+        seen_ids = []
+        while True:
+            response = self.send_request_to_view(
+                method="get", path_params={"pk": tag.id}, query_params=query_params
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen_ids += [item["id"] for item in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            next_query = parse_qs(urlparse(response.data["next"]).query)
+            query_params = {"cursor": next_query["cursor"][0], "limit": 2}
+
+        self.assertEqual(seen_ids, expected_ids)
+
+    def test_orders_list_by_tag_streams(self):
+        tag = OrderTag.objects.get()
+        serialized = OrderSerializer(tag.orders.order_by("id"), many=True).data
+        path_params = {"pk": tag.id}
+
+        response = self.send_request_to_view(
+            method="get", path_params=path_params, query_params={"stream": "json"}
+        )
+        content = b"".join(response.streaming_content)
+        self.assertEqual(json.loads(content), json.loads(json.dumps(serialized)))
+
+        response = self.send_request_to_view(
+            method="get", path_params=path_params, query_params={"stream": "ndjson"}
+        )
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            [json.loads(line)["id"] for line in lines],
+            [row["id"] for row in serialized],
+        )
+
+        response = self.send_request_to_view(
+            method="get", path_params=path_params, query_params={"stream": "xml"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_orders_list_by_tag_page_validators(self):
+        tag = OrderTag.objects.get()
+        add_orders(3, tag)
+        path_params, query_params = {"pk": tag.id}, {"limit": 2}
+        response = self.send_request_to_view(
+            method="get", path_params=path_params, query_params=query_params
+        )
+        headers = {"HTTP_IF_NONE_MATCH": response["ETag"]}
+        self.assertFalse(response.has_header("Last-Modified"))
+
+        # Changes past the page leave it fresh.
+        Order.objects.filter(tags=tag).order_by("-id").first().delete()
+        response = self.send_request_to_view(
+            method="get",
+            path_params=path_params,
+            query_params=query_params,
+            headers=headers,
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Order.objects.filter(tags=tag).order_by("id").first().delete()
+        response = self.send_request_to_view(
+            method="get",
+            path_params=path_params,
+            query_params=query_params,
+            headers=headers,
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_orders_list_by_tag_query_budget(self):
+        # tag, version stamps, tag links of the page, orders, inventories,
+        # documents and order tag links
+        tag = OrderTag.objects.get()
+        for count in (2, 5):
+            add_orders(count, tag)
+            cold_caches()
+            with self.assertNumQueries(7):
+                response = self.send_request_to_view(
+                    method="get", path_params={"pk": tag.id}
+                )
+            self.assertEqual(len(response.data["results"]), Order.objects.count())
+
     def test_orders_list_with_invalid_tag_id(self):
         path_params = {"pk": 10000}
         response = self.send_request_to_view(method="get", path_params=path_params)
@@ -98,8 +480,39 @@ class TestOrderTagsView(APIViewRequestFactory):
         response = self.send_request_to_view(method="get", path_params=path_params)
         serializer = OrderTagSerializer(tags, many=True)
 
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data["results"], serializer.data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_tags_list_streams(self):
+        order = Order.objects.first()
+        response = self.send_request_to_view(
+            method="get", path_params={"pk": order.id}, query_params={"stream": "json"}
+        )
+
+        self.assertEqual(
+            json.loads(b"".join(response.streaming_content)),
+            OrderTagSerializer(order.tags.all(), many=True).data,
+        )
+
+    def test_tags_list_conditional_get(self):
+        order = Order.objects.first()
+        path_params = {"pk": order.id}
+        response = self.send_request_to_view(method="get", path_params=path_params)
+        headers = {"HTTP_IF_NONE_MATCH": response["ETag"]}
+
+        response = self.send_request_to_view(
+            method="get", path_params=path_params, headers=headers
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        tag = order.tags.first()
+        tag.name = "Austin"
+        tag.save()
+        response = self.send_request_to_view(
+            method="get", path_params=path_params, headers=headers
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["name"], "Austin")
 
     def test_tags_list_with_invalid_order_id(self):
         path_params = {"pk": 10000}
@@ -107,3 +520,250 @@ class TestOrderTagsView(APIViewRequestFactory):
 
         self.assertEqual(response.data["detail"], "Not found.")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestOrderTagListCreateView(APIViewRequestFactory):
+    view_name = OrderTagListCreateView
+
+    def test_order_fields_are_not_parsed(self):
+        # ``fields`` selects order fields elsewhere; tags have no fieldset.
+        response = self.send_request_to_view(
+            method="get", query_params={"fields": "name"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, OrderTagSerializer(OrderTag.objects.all(), many=True).data
+        )
+
+
+@skipUnless(connection.vendor == "postgresql", "The benchmark needs Postgres")
+class TestBenchmarkOrderDatesCommand(APIViewRequestFactory):
+    def test_benchmark_shows_index_scan(self):
+        orders = Order.objects.count()
+        stdout = StringIO()
+
+        call_command("benchmark_order_dates", rows=50000, stdout=stdout)
+
+        without_index, with_index = stdout.getvalue().split("With ")
+        with_index = with_index.split("\n", 1)[1]
+        self.assertNotIn("order_start_embargo_idx", without_index)
+        self.assertIn("order_start_embargo_idx", with_index)
+
+        def returned(plan):
+            return int(re.search(r"actual time=\S+ rows=(\d+)", plan).group(1))
+
+        def filtered_out(plan):
+            return sum(map(int, re.findall(r"Rows Removed by Filter: (\d+)", plan)))
+
+        # The same rows, without reading the whole table.
+        self.assertEqual(returned(with_index), returned(without_index))
+        self.assertLess(filtered_out(with_index), filtered_out(without_index))
+        self.assertEqual(Order.objects.count(), orders)
+
+
+class TestOrderModel(APIViewRequestFactory):
+    def test_admin_str_does_not_query(self):
+        order_admin = OrderAdmin(Order, admin.site)
+        request = APIRequestFactory().get("/admin/order/order/")
+        order = order_admin.get_queryset(request).order_by("id").first()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(str(order), f"The Matrix - {order.start_date}")
+
+        # Without the inventory loaded, e.g. in logs.
+        order = Order.objects.get(pk=order.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(order), f"Order {order.pk} - {order.start_date}")
+
+    def test_save_rejects_overlapping_active_orders(self):
+        first = Order.objects.order_by("id").first()
+        window = {"start_date": first.embargo_date, "embargo_date": first.embargo_date}
+
+        with self.assertRaisesMessage(ValidationError, f"order(s) {first.id} "):
+            Order.objects.create(inventory=first.inventory, **window)
+        Order.objects.create(inventory=first.inventory, is_active=False, **window)
+        self.assertEqual(Order.objects.filter(**window).count(), 1)
+
+    def test_save_accepts_datetimes(self):
+        # As database.py seeds them.
+        first = Order.objects.order_by("id").first()
+        start = datetime.combine(first.embargo_date, time())
+
+        with self.assertRaisesMessage(ValidationError, f"order(s) {first.id} "):
+            Order.objects.create(
+                inventory=first.inventory, start_date=start, embargo_date=start
+            )
+        later = start + timedelta(days=30)
+        order = Order.objects.create(
+            inventory=first.inventory, start_date=later, embargo_date=later
+        )
+        self.assertEqual(Order.objects.get(pk=order.pk).start_date, later.date())
+
+    def test_bulk_activation(self):
+        orders = Order.objects.order_by("id")
+        first, second = orders
+        before = first.updated_at
+
+        self.assertEqual(Order.deactivate([first.pk, second.pk]), 2)
+        self.assertEqual(list(orders.values_list("is_active", flat=True)), [False] * 2)
+        self.assertGreater(orders.get(pk=first.pk).updated_at, before)
+        # Rows already in the requested state are not written again.
+        self.assertEqual(Order.deactivate(orders), 0)
+
+        self.assertEqual(Order.activate(first.pk), 1)
+        self.assertEqual(Order.activate(orders), 1)
+        self.assertTrue(all(orders.values_list("is_active", flat=True)))
+
+    def test_bulk_activation_rejects_overlapping_orders(self):
+        first, second = Order.objects.order_by("id")
+        Order.deactivate(first.pk)
+        Order.objects.create(
+            inventory=first.inventory,
+            start_date=first.start_date,
+            embargo_date=first.embargo_date,
+        )
+
+        with self.assertRaises(ValidationError) as raised:
+            Order.activate([first.pk, second.pk])
+
+        self.assertEqual(list(raised.exception.message_dict), [first.pk])
+        self.assertFalse(Order.objects.get(pk=first.pk).is_active)
+
+    def test_bulk_activation_of_a_vocabulary(self):
+        tag = OrderTag.objects.get()
+        get_vocabulary(OrderTag).load()
+
+        self.assertEqual(OrderTag.deactivate(OrderTag.objects.all()), 1)
+
+        self.assertFalse(get_vocabulary(OrderTag).get(tag.pk)["is_active"])
+
+
+class TestOrderStateView(APIViewRequestFactory):
+    def send_state_request(self, is_active, data):
+        request = APIRequestFactory().post("/fake_url/", data, format="json")
+        return OrderStateView.as_view(is_active=is_active)(request)
+
+    def test_deactivate_by_tag_then_activate_by_ids(self):
+        tag = OrderTag.objects.get()
+        ids = list(tag.orders.values_list("id", flat=True))
+
+        response = self.send_state_request(False, {"tag": tag.id})
+        self.assertEqual(response.data, {"is_active": False, "updated": 2})
+        self.assertFalse(Order.objects.filter(is_active=True).exists())
+
+        response = self.send_state_request(True, {"ids": ids[:1]})
+        self.assertEqual(response.data, {"is_active": True, "updated": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deactivate_by_inventory_and_window(self):
+        order = Order.objects.get(embargo_date=date.today() + timedelta(days=5))
+        data = {
+            "inventory": order.inventory_id,
+            "start": date.today().isoformat(),
+            "end": (date.today() + timedelta(days=7)).isoformat(),
+        }
+
+        response = self.send_state_request(False, data)
+
+        self.assertEqual(response.data["updated"], 1)
+        self.assertFalse(Order.objects.get(pk=order.pk).is_active)
+
+    def test_activation_rejects_overlapping_orders(self):
+        first, second = Order.objects.order_by("id")
+        Order.deactivate([first.id, second.id])
+        overlapping = Order.objects.create(
+            inventory=first.inventory,
+            start_date=first.start_date,
+            embargo_date=first.embargo_date,
+        )
+
+        response = self.send_state_request(True, {"ids": [first.id, second.id]})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data["conflicts"]), [first.id])
+        self.assertIn(str(overlapping.id), response.data["conflicts"][first.id])
+        # Nothing is activated when any order of the selection conflicts.
+        self.assertFalse(
+            Order.objects.filter(id__in=[first.id, second.id], is_active=True).exists()
+        )
+        response = self.send_state_request(True, {"ids": [second.id]})
+        self.assertEqual(response.data["updated"], 1)
+
+    def test_selection_is_required(self):
+        response = self.send_state_request(False, {})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.send_state_request(False, {"start": date.today().isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(Order.objects.filter(is_active=True).exists())
+
+
+class TestImportOrdersCommand(APIViewRequestFactory):
+    def test_import_csv(self):
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w") as source:
+            source.write(
+                "inventory,start_date,embargo_date,tags,is_active\n"
+                "The Matrix,2024-01-01,2024-02-01,San Antonio,false\n"
+                "The Matrix,2024-03-01,2024-04-01,,\n"
+                "Missing,2024-01-01,2024-02-01,San Antonio,true\n"
+            )
+        self.addCleanup(os.remove, path)
+        stdout = StringIO()
+
+        call_command("import_orders", path, stdout=stdout, stderr=StringIO())
+
+        self.assertIn("Imported 2 of 3 records", stdout.getvalue())
+        imported = Order.objects.get(start_date=date(2024, 1, 1))
+        self.assertFalse(imported.is_active)
+        self.assertEqual([tag.name for tag in imported.tags.all()], ["San Antonio"])
+        self.assertTrue(Order.objects.get(start_date=date(2024, 3, 1)).is_active)
+
+    def test_import_rejects_overlapping_active_orders(self):
+        overlapping = date.today() + timedelta(days=1)
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w") as source:
+            source.write(
+                "inventory,start_date,embargo_date,tags,is_active\n"
+                f"The Matrix,{overlapping},{overlapping},,true\n"
+                f"The Matrix,{overlapping},{overlapping},,false\n"
+                "The Matrix,2030-01-01,2030-02-01,,true\n"
+                "The Matrix,2030-01-15,2030-03-01,,true\n"
+                "The Matrix,2030-02-02,2030-03-01,,true\n"
+            )
+        self.addCleanup(os.remove, path)
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command("import_orders", path, stdout=stdout, stderr=stderr)
+
+        self.assertIn("Imported 3 of 5 records", stdout.getvalue())
+        stored = Order.objects.filter(is_active=True).order_by("id").first()
+        self.assertIn(
+            f"Record 1: {{'non_field_errors': ['Overlaps active order(s) {stored.id} ",
+            stderr.getvalue(),
+        )
+        self.assertIn(
+            "Record 4: {'non_field_errors': ['Overlaps another", stderr.getvalue()
+        )
+        self.assertFalse(Order.objects.filter(start_date=date(2030, 1, 15)).exists())
+
+
+class TestOrderRepresentations(APIViewRequestFactory):
+    def test_render_orders_matches_serializer_byte_for_byte(self):
+        order = Order.objects.first()
+        order.tags.add(OrderTag.objects.create(name="Rush", is_active=False))
+        Order.objects.create(
+            inventory=order.inventory,
+            start_date=date(2024, 1, 1),
+            embargo_date=date(2024, 2, 1),
+            is_active=False,
+        )
+        queryset = Order.objects.order_by("id")
+
+        serialized = OrderSerializer(queryset, many=True).data
+        rendered = render_orders(order_values(queryset))
+
+        self.assertEqual(
+            JSONRenderer().render(rendered), JSONRenderer().render(serialized)
+        )
@@ -1,6 +1,9 @@
 from django.urls import path
 from interview.order.views import (
+    OrderConflictsView,
     OrderListCreateView,
+    OrderMultiGetView,
+    OrderStateView,
     OrderTagListCreateView,
     DeactivateOrderView,
     OrderTagsView,
@@ -11,6 +14,18 @@ from interview.order.views import (
 urlpatterns = [
     path("tags/", OrderTagListCreateView.as_view(), name="order-detail"),
     path('tags/<int:pk>/', OrdersByTagView.as_view(), name='orders-by-tag'),
+    path("conflicts/", OrderConflictsView.as_view(), name="order-conflicts"),
+    path(
+        "activate/",
+        OrderStateView.as_view(is_active=True),
+        name="order-bulk-activate",
+    ),
+    path(
+        "deactivate/",
+        OrderStateView.as_view(is_active=False),
+        name="order-bulk-deactivate",
+    ),
+    path("multi/", OrderMultiGetView.as_view(), name="order-multi-get"),
     path("", OrderListCreateView.as_view(), name="order-list"),
     path("<int:pk>/deactivate/", DeactivateOrderView.as_view(), name="deactivate-order"),
     path('<int:pk>/tags/', OrderTagsView.as_view(), name='order-tags'),
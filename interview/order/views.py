@@ -1,4 +1,7 @@
+from psycopg2.extras import DateRange
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.views import APIView
@@ -6,18 +9,123 @@ from rest_framework.views import APIView
 from django.shortcuts import render, get_object_or_404
 from django.utils.dateparse import parse_date
 
-from interview.order.models import Order, OrderTag
-from interview.order.serializers import OrderSerializer, OrderTagSerializer
+from interview.core import conditional
+from interview.core.multiget import MultiGetView
+from interview.core.streaming import (
+    NDJSONRenderer,
+    get_stream_format,
+    render_chunks,
+    streaming_response,
+)
+from interview.core.versions import get_version
+from interview.inventory import cache as inventory_cache
+from interview.order import batch
+from interview.order.models import VOCABULARY_VERSION, Order, OrderTag, order_period
+from interview.order.pagination import (
+    OrderKeysetPagination,
+    OrderPagination,
+    OrderPeriodPagination,
+    TagOrdersPagination,
+)
+from interview.order.representations import (
+    order_fieldset,
+    order_representations,
+    order_values,
+    render_orders,
+)
+from interview.order.serializers import (
+    OrderSelectionSerializer,
+    OrderSerializer,
+    OrderTagSerializer,
+)
+
+
+def order_versions():
+    """Version stamps of the vocabularies nested in order representations."""
+    return [get_version(VOCABULARY_VERSION), inventory_cache.get_generation()]
+
 
-# Create your views here.
 class OrderListCreateView(generics.ListCreateAPIView):
+    """
+    Orders, optionally filtered by date:
+
+    - ``?start=&end=``: orders whose window lies within ``[start, end]``;
+    - ``?start=&end=&mode=overlap``: orders live at any point of the window;
+    - ``?on=``: orders live on that date.
+
+    The last two go through the ``order_period`` GiST index and are always
+    paginated.
+    """
+
     serializer_class = OrderSerializer
+    pagination_class = OrderPagination
+    modes = ("within", "overlap")
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        fieldset = order_fieldset(request)
+        queryset = self.filter_queryset(self.get_queryset())
+        fields = ("updated_at", "inventory__updated_at")
+        versions = order_versions()
+        # See ``InventoryListCreateView.get``.
+        exact = self.paginator.counts_exactly(request)
+        if exact:
+            validators = conditional.queryset_validators(
+                request, queryset, fields, versions
+            )
+            response = conditional.not_modified(request, validators)
+            if response is not None:
+                return response
+
+        rows = order_values(queryset)
+        page = self.paginate_queryset(rows)
+        if not exact:
+            validators = conditional.rows_validators(
+                request, page, fields, versions, self.paginator.validator_parts()
+            )
+            response = conditional.not_modified(request, validators)
+            if response is not None:
+                return response
+
+        if page is not None:
+            data = order_representations(page, fieldset)
+            response = self.get_paginated_response(data)
+        else:
+            response = Response(order_representations(rows, fieldset))
+        return conditional.set_validators(response, validators)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.get_mode() == "within" and "on" not in self.request.query_params:
+                self._paginator = self.pagination_class()
+            else:
+                self._paginator = OrderPeriodPagination()
+        return self._paginator
+
+    def get_mode(self) -> str:
+        mode = self.request.query_params.get("mode", "within")
+        if mode not in self.modes:
+            expected = ", ".join(self.modes)
+            raise ValidationError({"mode": [f"Expected one of {expected}."]})
+        return mode
 
     def get_queryset(self):
         queryset = Order.objects.all()
+        params = self.request.query_params
+
+        if "on" in params:
+            day = parse_date(params["on"])
+            if not day:
+                return queryset.none()
+            return (
+                queryset.alias(period=order_period())
+                .filter(period__contains=day)
+                .order_by("id")
+            )
 
-        start = parse_date(self.request.query_params.get("start", ""))
-        end = parse_date(self.request.query_params.get("end", ""))
+        mode = self.get_mode()
+        start = parse_date(params.get("start", ""))
+        end = parse_date(params.get("end", ""))
 
         if not start and not end:
             return queryset
@@ -25,33 +133,183 @@ class OrderListCreateView(generics.ListCreateAPIView):
         if not start or not end:
             return queryset.none()
 
-        return queryset.filter(start_date__gte=start, embargo_date__lte=end)
+        if mode == "overlap":
+            return (
+                queryset.alias(period=order_period())
+                .filter(period__overlap=DateRange(start, end, "[]"))
+                .order_by("id")
+            )
+        return queryset.within(start, end)
+
+
+class OrderMultiGetView(MultiGetView):
+    """Orders by id, see ``MultiGetView``; supports sparse fieldsets."""
+
+    queryset = Order.objects.all()
+
+    def get_rows(self, ids):
+        self.fieldset = order_fieldset(self.request)
+        return order_values(self.queryset.filter(id__in=ids))
+
+    def render(self, rows) -> list:
+        return order_representations(rows, self.fieldset)
+
+
+class OrderConflictsView(generics.ListAPIView):
+    """
+    Active orders overlapping another active order of the same inventory
+    (``OrderQuerySet.conflicting``), optionally of one ``?inventory=``, with
+    the ids of the orders they conflict with. Always paginated.
+    """
+
+    pagination_class = OrderPeriodPagination
+
+    def get_queryset(self):
+        queryset = Order.objects.all()
+        inventory = self.request.query_params.get("inventory")
+        if inventory is not None:
+            if not inventory.isdigit():
+                raise ValidationError({"inventory": ["Expected an inventory id."]})
+            queryset = queryset.filter(inventory_id=int(inventory))
+        return (
+            queryset.conflicting()
+            .order_by("id")
+            .values("id", "inventory_id", "start_date", "embargo_date", "conflicts")
+        )
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        page = self.paginate_queryset(self.get_queryset())
+        data = [
+            {
+                "id": row["id"],
+                "inventory": row["inventory_id"],
+                "start_date": row["start_date"],
+                "embargo_date": row["embargo_date"],
+                "conflicts": row["conflicts"],
+            }
+            for row in page
+        ]
+        return self.get_paginated_response(data)
 
 
 class OrdersByTagView(APIView):
+    """
+    Orders of a tag, keyset paginated by id, or streamed as one JSON array or
+    as NDJSON with ``?stream=json|ndjson``. Either way memory use is bounded
+    by a page or a chunk, not by the popularity of the tag. Pages are read
+    from the through table first (see ``TagOrdersPagination``) and their
+    validators come from the rows of the page only.
+    """
+
+    pagination_class = TagOrdersPagination
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+    chunk_size = 2000
+
     def get(self, request, pk):
+        fieldset = order_fieldset(request)
+        stream = get_stream_format(request)
         tag = get_object_or_404(OrderTag, id=pk)
-        orders = tag.orders.all()
-        serializer = OrderSerializer(orders, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if stream is not None:
+            rows = order_values(Order.objects.filter(tags=tag).order_by("id"))
+            items = render_chunks(
+                rows, lambda chunk: render_orders(chunk, fieldset), self.chunk_size
+            )
+            return streaming_response(items, stream)
+
+        paginator = self.pagination_class()
+        links = Order.tags.through.objects.filter(ordertag_id=tag.id)
+        page = paginator.paginate_queryset(links.values("order_id"), request, self)
+        ids = [link["order_id"] for link in page]
+        rows = list(order_values(Order.objects.filter(id__in=ids).order_by("id")))
+        validators = conditional.rows_validators(
+            request,
+            rows,
+            ("updated_at", "inventory__updated_at"),
+            order_versions(),
+            [paginator.has_next],
+        )
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
+
+        data = order_representations(rows, fieldset)
+        response = paginator.get_paginated_response(data)
+        return conditional.set_validators(response, validators)
 
 
 class DeactivateOrderView(APIView):
     def patch(self, request: Request, pk: int, *args, **kwargs) -> Response:
-        order = get_object_or_404(Order, id=pk)
-        order.is_active = False
-        order.save()
+        order = get_object_or_404(Order.objects.only("id"), id=pk)
+        Order.deactivate(order.pk)
         return Response({"message": f"Order {pk} has been deactivated."}, status=status.HTTP_200_OK)
 
 
+class OrderStateView(APIView):
+    """
+    Activate (``is_active=True``) or deactivate the orders selected by
+    ``OrderSelectionSerializer`` with one set-based ``UPDATE``, see
+    ``IsActiveModel.set_active``. Responds with the number of orders changed.
+    Activation is refused with a 400 listing the orders that would overlap an
+    active order, see ``batch.activate_orders``.
+    """
+
+    is_active = None
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        serializer = OrderSelectionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if self.is_active:
+            updated = batch.activate_orders(serializer.get_queryset())
+        else:
+            updated = Order.deactivate(serializer.get_queryset())
+        return Response(
+            {"is_active": self.is_active, "updated": updated},
+            status=status.HTTP_200_OK,
+        )
+
+
 class OrderTagListCreateView(generics.ListCreateAPIView):
     queryset = OrderTag.objects.all()
     serializer_class = OrderTagSerializer
 
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        validators = conditional.queryset_validators(request, self.get_queryset())
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
+
+        response = super().list(request, *args, **kwargs)
+        return conditional.set_validators(response, validators)
+
 
 class OrderTagsView(APIView):
+    """Tags of an order, paginated or streamed like ``OrdersByTagView``."""
+
+    pagination_class = OrderKeysetPagination
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+    chunk_size = 2000
+
     def get(self, request, pk):
+        stream = get_stream_format(request)
         order = get_object_or_404(Order, id=pk)
         tags = order.tags.all()
-        serializer = OrderTagSerializer(tags, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        if stream is not None:
+            items = render_chunks(
+                tags.order_by("id"),
+                lambda chunk: OrderTagSerializer(chunk, many=True).data,
+                self.chunk_size,
+            )
+            return streaming_response(items, stream)
+
+        validators = conditional.instance_validators(
+            request, order, versions=[get_version(VOCABULARY_VERSION)]
+        )
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(tags, request, self)
+        serializer = OrderTagSerializer(page, many=True)
+        response = paginator.get_paginated_response(serializer.data)
+        return conditional.set_validators(response, validators)
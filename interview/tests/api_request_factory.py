@@ -1,9 +1,11 @@
 from urllib.parse import urlencode
 from datetime import date, timedelta
 
+from django.core.cache import caches
 from django.test import TestCase
 from rest_framework.test import APIRequestFactory
 
+from interview.core.versions import pinned_versions
 from interview.inventory.models import (
     Inventory,
     InventoryType,
@@ -48,7 +50,7 @@ class APIViewRequestFactory(TestCase):
         order2 = Order.objects.create(
             is_active=True,
             inventory=inventory,
-            start_date=date.today(),
+            start_date=date.today() + timedelta(days=6),
             embargo_date=date.today() + timedelta(days=10),
         )
         order2.tags.add(order_tag)
@@ -61,9 +63,17 @@ class APIViewRequestFactory(TestCase):
         InventoryLanguage.objects.all().delete()
         super().tearDownClass()
 
-    def send_request_to_view(self, method, path_params=None, query_params=None, data=None):
+    def setUp(self):
+        super().setUp()
+        for cache in caches.all():
+            cache.clear()
+
+    def send_request_to_view(
+        self, method, path_params=None, query_params=None, data=None, headers=None
+    ):
         path_params = path_params or {}
         query_params = query_params or {}
+        headers = headers or {}
 
         factory = APIRequestFactory()
         view = self.view_name.as_view()
@@ -71,7 +81,9 @@ class APIViewRequestFactory(TestCase):
         query_string = urlencode(query_params)
         url = f"/fake_url/?{query_string}" if query_string else "/fake_url/"
 
-        request = getattr(factory, method.lower())(url, data)
+        request = getattr(factory, method.lower())(url, data, **headers)
         request.query_params = query_params
-        response = view(request, **path_params)
+        # As PinnedVersionsMiddleware does for real requests.
+        with pinned_versions():
+            response = view(request, **path_params)
         return response